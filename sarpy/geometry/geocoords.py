@@ -61,22 +61,25 @@ def ecf_to_geodetic(ecf, ordering='latlong'):
 
     llh = numpy.full(ecf.shape, numpy.nan, dtype=numpy.float64)
 
-    r = numpy.sqrt((x * x) + (y * y))
+    r2 = (x * x) + (y * y)
+    z2 = z*z
+    r = numpy.sqrt(r2)
 
     # Check for invalid solution
-    valid = ((_A*r)*(_A*r) + (_B*z)*(_B*z) > (_A2 - _B2)*(_A2 - _B2))
+    valid = (_A2*r2 + _B2*z2 > (_A2 - _B2)*(_A2 - _B2))
 
     # calculate intermediates
-    F = 54.0*_B2*z*z  # not the WGS 84 flattening parameter
-    G = r*r + _OME2*z*z - _E2*(_A2 - _B2)
-    C = _E4*F*r*r/(G*G*G)
+    F = 54.0*_B2*z2  # not the WGS 84 flattening parameter
+    G = r2 + _OME2*z2 - _E2*(_A2 - _B2)
+    C = _E4*F*r2/(G*G*G)
     S = (1.0 + C + numpy.sqrt(C*C + 2*C))**(1./3)
     P = F/(3.0*(G*(S + 1.0/S + 1.0))**2)
     Q = numpy.sqrt(1.0 + 2.0*_E4*P)
-    R0 = -P*_E2*r/(1.0 + Q) + numpy.sqrt(numpy.abs(0.5*_A2*(1.0 + 1/Q) - P*_OME2*z*z/(Q*(1.0 + Q)) - 0.5*P*r*r))
+    R0 = -P*_E2*r/(1.0 + Q) + numpy.sqrt(numpy.abs(0.5*_A2*(1.0 + 1/Q) - P*_OME2*z2/(Q*(1.0 + Q)) - 0.5*P*r2))
     T = r - _E2*R0
-    U = numpy.sqrt(T*T + z*z)
-    V = numpy.sqrt(T*T + _OME2*z*z)
+    T2 = T*T
+    U = numpy.sqrt(T2 + z2)
+    V = numpy.sqrt(T2 + _OME2*z2)
     z0 = _B2*z/(_A*V)
 
     # account for ordering
@@ -122,13 +125,19 @@ def geodetic_to_ecf(llh, ordering='latlong'):
     alt = llh[:, inds[2]]
 
     out = numpy.full(llh.shape, numpy.nan, dtype=numpy.float64)
+    # evaluate the trigonometric terms only once
+    lat_rad = numpy.deg2rad(lat)
+    lon_rad = numpy.deg2rad(lon)
+    sin_lat = numpy.sin(lat_rad)
+    cos_lat = numpy.cos(lat_rad)
     # calculate distance to surface of ellipsoid
-    r = _A / numpy.sqrt(1.0 - _E2*numpy.sin(numpy.deg2rad(lat)) * numpy.sin(numpy.deg2rad(lat)))
+    r = _A / numpy.sqrt(1.0 - _E2*sin_lat*sin_lat)
 
     # calculate coordinates
-    out[:, 0] = (r + alt)*numpy.cos(numpy.deg2rad(lat))*numpy.cos(numpy.deg2rad(lon))
-    out[:, 1] = (r + alt)*numpy.cos(numpy.deg2rad(lat))*numpy.sin(numpy.deg2rad(lon))
-    out[:, 2] = (r + alt - _E2*r)*numpy.sin(numpy.deg2rad(lat))
+    r_cos_lat = (r + alt)*cos_lat
+    out[:, 0] = r_cos_lat*numpy.cos(lon_rad)
+    out[:, 1] = r_cos_lat*numpy.sin(lon_rad)
+    out[:, 2] = (r + alt - _E2*r)*sin_lat
     return numpy.reshape(out, orig_shape)
 
 
@@ -3,7 +3,7 @@ Functions to map between the coordinates in image pixel space and geographical c
 """
 
 import logging
-from typing import Tuple
+from typing import Tuple, Union
 from types import MethodType  # for binding a method dynamically to a class
 
 import numpy
@@ -67,78 +67,129 @@ def _ground_to_image(coords, coa_proj, uGPN,
         * `image_points` - the determined image point array, of size `N x 2`. Following SICD convention,
            the upper-left pixel is [0, 0].
         * `delta_gpn` - residual ground plane displacement (m).
-        * `iterations` - the number of iterations performed.
+        * `iterations` - the number of iterations performed, for each point.
     """
+
+    num_points = coords.shape[0]
     g_n = coords.copy()
-    im_points = numpy.zeros((coords.shape[0], 2), dtype=numpy.float64)
-    delta_gpn = numpy.zeros((coords.shape[0],), dtype=numpy.float64)
-    cont = True
+    im_points = numpy.zeros((num_points, 2), dtype=numpy.float64)
+    delta_gpn = numpy.zeros((num_points, ), dtype=numpy.float64)
+    iterations = numpy.zeros((num_points, ), dtype=numpy.int16)
+    # the indices of the points which have not yet converged
+    active = numpy.arange(num_points)
     iteration = 0
 
     matrix_transform = numpy.dot(row_col_transform, ipp_transform)
     # (3 x 2)*(2 x 2) = (3 x 2)
 
-    while cont:
-        # project ground plane to image plane iteration
+    while active.size > 0:
+        # project ground plane to image plane iteration, only for the points still in play
         iteration += 1
-        dist_n = numpy.dot(SCP - g_n, uIPN)/sf  # (N, )
-        i_n = g_n + numpy.outer(dist_n, uProj)  # (N, 3)
+        g_a = g_n[active, :]
+        dist_n = numpy.dot(SCP - g_a, uIPN)/sf  # (N, )
+        i_n = g_a + numpy.outer(dist_n, uProj)  # (N, 3)
         delta_ipp = i_n - SCP  # (N, 3)
         ip_iter = numpy.dot(delta_ipp, matrix_transform)  # (N, 2)
-        im_points[:, 0] = ip_iter[:, 0]/row_ss + SCP_Pixel[0]
-        im_points[:, 1] = ip_iter[:, 1]/col_ss + SCP_Pixel[1]
+        im_a = numpy.empty((active.size, 2), dtype=numpy.float64)
+        im_a[:, 0] = ip_iter[:, 0]/row_ss + SCP_Pixel[0]
+        im_a[:, 1] = ip_iter[:, 1]/col_ss + SCP_Pixel[1]
         # transform to ground plane containing the scene points and check how it compares
-        p_n = _image_to_ground_plane(im_points, coa_proj, g_n, uGPN)
+        p_n = _image_to_ground_plane(im_a, coa_proj, g_a, uGPN)
         # compute displacement between scene point and this new projected point
-        diff_n = coords - p_n
+        diff_n = coords[active, :] - p_n
         disp_pn = numpy.linalg.norm(diff_n, axis=1)
-        # should we continue iterating?
-        cont = numpy.any(disp_pn > delta_gp_max) or (iteration <= max_iterations)
-        if cont:
-            g_n += diff_n
+        im_points[active, :] = im_a
+        delta_gpn[active] = disp_pn
+        iterations[active] = iteration
+        if iteration > max_iterations:
+            break
+        # should we continue iterating? NB: each point stops once it has converged
+        not_converged = (disp_pn > delta_gp_max)
+        active = active[not_converged]
+        g_n[active, :] += diff_n[not_converged, :]
 
-    return im_points, delta_gpn, iteration
+    return im_points, delta_gpn, iterations
 
 
-def ground_to_image(coords, sicd, delta_gp_max=None, max_iterations=10, block_size=50000,
-                    delta_arp=None, delta_varp=None, range_bias=None, adj_params_frame='ECF',
-                    use_sicd_coa=True):
+def _get_scene_to_image_parameters(sicd, coa_proj):
     """
-    Transforms a 3D ECF point to pixel (row/column) coordinates. This is
-    implemented in accordance with the SICD Image Projections Description Document.
-    **Really Scene-To-Image projection.**"
+    Gets the fixed geometry parameters for the scene to image projection. These
+    depend only on the sicd structure, so are cached on the COA projection object,
+    which is itself fixed for the sicd when defined via `sicd.define_coa_projection()`.
+
+    Parameters
+    ----------
+    sicd : sarpy.io.complex.sicd_elements.SICD.SICDType
+    coa_proj : COAProjection
+
+    Returns
+    -------
+    tuple
+        The SCP, SCP pixel, ground plane normal, image plane normal, slant plane normal,
+        scale factor, row/column transform and image plane transform.
+    """
+
+    params = coa_proj.scene_to_image_parameters
+    if params is not None:
+        return params
+
+    SCP_Pixel = sicd.ImageData.SCPPixel.get_array()
+    uRow = sicd.Grid.Row.UVectECF.get_array()  # unit normal in row direction
+    uCol = sicd.Grid.Col.UVectECF.get_array()  # unit normal in column direction
+    uIPN = numpy.cross(uRow, uCol)  # image plane unit normal
+    uIPN /= numpy.linalg.norm(uIPN)  # NB: uRow/uCol may not be perpendicular
+    cos_theta = numpy.dot(uRow, uCol)
+    sin_theta = numpy.sqrt(1 - cos_theta*cos_theta)
+    ipp_transform = numpy.array([[1, -cos_theta], [-cos_theta, 1]], dtype=numpy.float64)/(sin_theta*sin_theta)
+    row_col_transform = numpy.zeros((3, 2), dtype=numpy.float64)
+    row_col_transform[:, 0] = uRow
+    row_col_transform[:, 1] = uCol
+
+    SCP = sicd.GeoData.SCP.ECF.get_array()
+    uGPN = sicd.PFA.FPN.get_array() if sicd.ImageFormation.ImageFormAlgo == 'PFA' \
+        else geocoords.wgs_84_norm(SCP)
+    ARP_SCP_COA = sicd.SCPCOA.ARPPos.get_array()
+    VARP_SCP_COA = sicd.SCPCOA.ARPVel.get_array()
+    uSPN = sicd.SCPCOA.look*numpy.cross(VARP_SCP_COA, SCP-ARP_SCP_COA)
+    uSPN /= numpy.linalg.norm(uSPN)
+    # uSPN - defined in section 3.1 as normal to instantaneous slant plane that contains SCP at SCP COA is
+    # tangent to R/Rdot contour at SCP. Points away from center of Earth. Use look to establish sign.
+    sf = float(numpy.dot(uSPN, uIPN))  # scale factor
+
+    params = (SCP, SCP_Pixel, uGPN, uIPN, uSPN, sf, row_col_transform, ipp_transform)
+    coa_proj.scene_to_image_parameters = params
+    return params
+
+
+def _identity_transform(coords):
+    return coords
+
+
+def _ground_to_image_blocks(
+        coords, sicd, coords_transform, delta_gp_max, max_iterations, block_size,
+        delta_arp, delta_varp, range_bias, adj_params_frame, use_sicd_coa):
+    """
+    Helper function for the ground to image projection, which applies `coords_transform`
+    (to convert to ECF coordinates) to each block of coordinates in turn, just before
+    projecting it. This avoids a full size intermediate array of ECF coordinates.
 
     Parameters
     ----------
     coords : numpy.ndarray|tuple|list
-        ECF coordinate to map to scene coordinates, of size `N x 3`.
     sicd : sarpy.io.complex.sicd_elements.SICD.SICDType
-        SICD meta data structure.
+    coords_transform : None|callable
     delta_gp_max : float|None
-        Ground plane displacement tol (m). Defaults to 0.1*pixel.
     max_iterations : int
-        maximum number of iterations to perform
     block_size : int|None
-        size of blocks of coordinates to transform at a time
     delta_arp : None|numpy.ndarray|list|tuple
-        ARP position adjustable parameter (ECF, m).  Defaults to 0 in each coordinate.
     delta_varp : None|numpy.ndarray|list|tuple
-        VARP position adjustable parameter (ECF, m/s).  Defaults to 0 in each coordinate.
     range_bias : float|int
-        Range bias adjustable parameter (m), defaults to 0.
     adj_params_frame : str
-        One of ['ECF', 'RIC_ECF', 'RIC_ECI'], specifying the coordinate frame used for
-        expressing `delta_arp` and `delta_varp` parameters.
     use_sicd_coa : bool
-        If sicd.coa_projection is populated, use that one **ignoring the COAProjection parameters.**
 
     Returns
     -------
     Tuple[numpy.ndarray, float, int]
-        * `image_points` - the determined image point array, of size `N x 2`. Following
-          the SICD convention, he upper-left pixel is [0, 0].
-        * `delta_gpn` - residual ground plane displacement (m).
-        * `iterations` - the number of iterations performed.
     """
 
     coords, orig_shape = _validate_coords(coords, sicd)
@@ -159,39 +210,19 @@ def ground_to_image(coords, sicd, delta_gp_max=None, max_iterations=10, block_si
     else:
         coa_proj = COAProjection(sicd, delta_arp, delta_varp, range_bias, adj_params_frame)
 
-    # establishing the basic projection components
-    SCP_Pixel = sicd.ImageData.SCPPixel.get_array()
-    uRow = sicd.Grid.Row.UVectECF.get_array()  # unit normal in row direction
-    uCol = sicd.Grid.Col.UVectECF.get_array()  # unit normal in column direction
-    uIPN = numpy.cross(uRow, uCol)  # image plane unit normal
-    uIPN /= numpy.linalg.norm(uIPN)  # NB: uRow/uCol may not be perpendicular
-    cos_theta = numpy.dot(uRow, uCol)
-    sin_theta = numpy.sqrt(1 - cos_theta*cos_theta)
-    ipp_transform = numpy.array([[1, -cos_theta], [-cos_theta, 1]], dtype=numpy.float64)/(sin_theta*sin_theta)
-    row_col_transform = numpy.zeros((3, 2), dtype=numpy.float64)
-    row_col_transform[:, 0] = uRow
-    row_col_transform[:, 1] = uCol
-
-    SCP = sicd.GeoData.SCP.ECF.get_array()
-    uGPN = sicd.PFA.FPN.get_array() if sicd.ImageFormation.ImageFormAlgo == 'PFA' \
-        else geocoords.wgs_84_norm(SCP)
-    ARP_SCP_COA = sicd.SCPCOA.ARPPos.get_array()
-    VARP_SCP_COA = sicd.SCPCOA.ARPVel.get_array()
-    uSPN = sicd.SCPCOA.look*numpy.cross(VARP_SCP_COA, SCP-ARP_SCP_COA)
-    uSPN /= numpy.linalg.norm(uSPN)
-    # uSPN - defined in section 3.1 as normal to instantaneous slant plane that contains SCP at SCP COA is
-    # tangent to R/Rdot contour at SCP. Points away from center of Earth. Use look to establish sign.
-    sf = float(numpy.dot(uSPN, uIPN))  # scale factor
+    SCP, SCP_Pixel, uGPN, uIPN, uSPN, sf, row_col_transform, ipp_transform = \
+        _get_scene_to_image_parameters(sicd, coa_proj)
 
     # prepare the work space
     coords_view = numpy.reshape(coords, (-1, 3))  # possibly or make 2-d flatten
     num_points = coords_view.shape[0]
+    if coords_transform is None:
+        coords_transform = _identity_transform
     if block_size is None or num_points <= block_size:
         image_points, delta_gpn, iters = _ground_to_image(
-            coords_view, coa_proj, uGPN,
+            coords_transform(coords_view), coa_proj, uGPN,
             SCP, SCP_Pixel, uIPN, sf, row_ss, col_ss, uSPN,
             row_col_transform, ipp_transform, delta_gp_max, max_iterations)
-        iters = numpy.full((num_points, ), iters)
     else:
         image_points = numpy.zeros((num_points, 2), dtype=numpy.float64)
         delta_gpn = numpy.zeros((num_points, ), dtype=numpy.float64)
@@ -203,7 +234,7 @@ def ground_to_image(coords, sicd, delta_gp_max=None, max_iterations=10, block_si
             end_block = min(start_block+block_size, num_points)
             image_points[start_block:end_block, :], delta_gpn[start_block:end_block], \
                 iters[start_block:end_block] = _ground_to_image(
-                    coords_view[start_block:end_block, :], coa_proj, uGPN,
+                    coords_transform(coords_view[start_block:end_block, :]), coa_proj, uGPN,
                     SCP, SCP_Pixel, uIPN, sf, row_ss, col_ss, uSPN,
                     row_col_transform, ipp_transform, delta_gp_max, max_iterations)
             start_block = end_block
@@ -217,7 +248,56 @@ def ground_to_image(coords, sicd, delta_gp_max=None, max_iterations=10, block_si
     return image_points, delta_gpn, iters
 
 
-def ground_to_image_geo(coords, sicd, ordering='latlong', **kwargs):
+
+def ground_to_image(coords, sicd, delta_gp_max=None, max_iterations=10, block_size=50000,
+                    delta_arp=None, delta_varp=None, range_bias=None, adj_params_frame='ECF',
+                    use_sicd_coa=True):
+    """
+    Transforms a 3D ECF point to pixel (row/column) coordinates. This is
+    implemented in accordance with the SICD Image Projections Description Document.
+    **Really Scene-To-Image projection.**"
+
+    Parameters
+    ----------
+    coords : numpy.ndarray|tuple|list
+        ECF coordinate to map to scene coordinates, of size `N x 3`.
+    sicd : sarpy.io.complex.sicd_elements.SICD.SICDType
+        SICD meta data structure.
+    delta_gp_max : float|None
+        Ground plane displacement tol (m). Defaults to 0.1*pixel.
+    max_iterations : int
+        maximum number of iterations to perform
+    block_size : int|None
+        size of blocks of coordinates to transform at a time
+    delta_arp : None|numpy.ndarray|list|tuple
+        ARP position adjustable parameter (ECF, m).  Defaults to 0 in each coordinate.
+    delta_varp : None|numpy.ndarray|list|tuple
+        VARP position adjustable parameter (ECF, m/s).  Defaults to 0 in each coordinate.
+    range_bias : float|int
+        Range bias adjustable parameter (m), defaults to 0.
+    adj_params_frame : str
+        One of ['ECF', 'RIC_ECF', 'RIC_ECI'], specifying the coordinate frame used for
+        expressing `delta_arp` and `delta_varp` parameters.
+    use_sicd_coa : bool
+        If sicd.coa_projection is populated, use that one **ignoring the COAProjection parameters.**
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, float, int]
+        * `image_points` - the determined image point array, of size `N x 2`. Following
+          the SICD convention, he upper-left pixel is [0, 0].
+        * `delta_gpn` - residual ground plane displacement (m).
+        * `iterations` - the number of iterations performed.
+    """
+
+    return _ground_to_image_blocks(
+        coords, sicd, None, delta_gp_max, max_iterations, block_size,
+        delta_arp, delta_varp, range_bias, adj_params_frame, use_sicd_coa)
+
+
+def ground_to_image_geo(coords, sicd, ordering='latlong', delta_gp_max=None, max_iterations=10, block_size=50000,
+                        delta_arp=None, delta_varp=None, range_bias=None, adj_params_frame='ECF',
+                        use_sicd_coa=True):
     """
     Transforms a 3D Lat/Lon/HAE point to pixel (row/column) coordinates.
     This is implemented in accordance with the SICD Image Projections Description Document.
@@ -232,7 +312,14 @@ def ground_to_image_geo(coords, sicd, ordering='latlong', **kwargs):
         If 'longlat', then the input is `[longitude, latitude, hae]`.
         Otherwise, the input is `[latitude, longitude, hae]`. Passed through
         to :func:`sarpy.geometry.geocoords.geodetic_to_ecf`.
-    kwargs
+    delta_gp_max : float|None
+    max_iterations : int
+    block_size : int|None
+    delta_arp : None|numpy.ndarray|list|tuple
+    delta_varp : None|numpy.ndarray|list|tuple
+    range_bias : float|int
+    adj_params_frame : str
+    use_sicd_coa : bool
         See the key word arguments of :func:`ground_to_image`
 
     Returns
@@ -244,7 +331,13 @@ def ground_to_image_geo(coords, sicd, ordering='latlong', **kwargs):
         * `iterations` - the number of iterations performed.
     """
 
-    return ground_to_image(geocoords.geodetic_to_ecf(coords, ordering=ordering), sicd, **kwargs)
+    def coords_transform(llh):
+        return geocoords.geodetic_to_ecf(llh, ordering=ordering)
+
+    # NB: the conversion to ECF is performed block by block, in the midst of projection
+    return _ground_to_image_blocks(
+        coords, sicd, coords_transform, delta_gp_max, max_iterations, block_size,
+        delta_arp, delta_varp, range_bias, adj_params_frame, use_sicd_coa)
 
 
 ############
@@ -356,6 +449,8 @@ class COAProjection(object):
         else:
             range_bias = float(range_bias)
         self.range_bias = range_bias  # type: float
+        # the scene to image projection parameters, populated on first use
+        self.scene_to_image_parameters = None  # type: Union[None, tuple]
         # bind the method specific intermediate projection method
         self._method_proj = MethodType(_get_type_specific_projection(sicd), self)
 
@@ -547,7 +642,7 @@ def _get_type_specific_projection(sicd):
     def plane_projection():
         SCP = sicd.GeoData.SCP.ECF.get_array()
         uRow = sicd.Grid.Row.UVectECF.get_array()
-        uCol = sicd.Grid.Row.UVectECF.get_array()
+        uCol = sicd.Grid.Col.UVectECF.get_array()
 
         # noinspection PyUnusedLocal, PyIncorrectDocstring
         def method_projection(instance, row_meters, col_meters, t_coa, arp_coa, varp_coa):
@@ -889,11 +984,11 @@ def _image_to_ground_hae_perform(
         gpp_llh = geocoords.ecf_to_geodetic(gpp)
         delta_hae = gpp_llh[:, 2] - hae0
         abs_delta_hae = numpy.abs(delta_hae)
-        # should we stop our iteration?
-        cont = numpy.all(abs_delta_hae > delta_hae_max) and (iters <= hae_nlim)
+        # should we stop our iteration? NB: one convergence check across the whole block
+        cont = numpy.any(abs_delta_hae > delta_hae_max) and (iters <= hae_nlim)
         if cont:
-            delta_hae_min = delta_hae[numpy.argmin(abs_delta_hae)]
-            gref -= delta_hae_min*ugpn
+            # move the reference point for each row along the ground plane normal independently
+            gref = gref - numpy.outer(delta_hae, ugpn)
     # Compute the unit slant plane normal vector, uspn, that is tangent to the R/Rdot contour at point gpp
     uspn = (numpy.cross(varp_coa, (gpp - arp_coa)).T*look).T
     uspn = (uspn.T/numpy.linalg.norm(uspn, axis=-1)).T
@@ -362,8 +362,8 @@ class DTEDReader(object):
         fx = (lon - self._origin[0])/self._spacing[0]
         fy = (lat - self._origin[1])/self._spacing[1]
 
-        ix = numpy.cast[numpy.int32](numpy.floor(fx))
-        iy = numpy.cast[numpy.int32](numpy.floor(fy))
+        ix = numpy.floor(fx).astype(numpy.int32)
+        iy = numpy.floor(fy).astype(numpy.int32)
 
         dx = fx - ix
         dy = fy - iy
@@ -222,10 +222,7 @@ class ImageDataType(Serializable):
 
         if self.ValidData is None:
             return None
-        out = numpy.zeros((self.ValidData.size, 2), dtype=dtype)
-        for i, entry in enumerate(self.ValidData):
-            out[i, :] = entry.get_array(dtype=dtype)
-        return out
+        return numpy.array([[entry.Row, entry.Col] for entry in self.ValidData], dtype=dtype)
 
     def get_full_vertex_data(self, dtype=numpy.int64):
         """
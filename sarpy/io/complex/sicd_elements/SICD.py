@@ -5,13 +5,13 @@ The SICDType definition.
 
 import logging
 import copy
+import math
 from datetime import datetime
-import re
-from collections import OrderedDict
+from operator import attrgetter
 
 import numpy
 
-from .base import Serializable, _SerializableDescriptor, DEFAULT_STRICT
+from .base import Serializable, _SerializableDescriptor, DEFAULT_STRICT, ordered_dict, integer_types
 from .CollectionInfo import CollectionInfoType
 from .ImageCreation import ImageCreationType
 from .ImageData import ImageDataType
@@ -31,7 +31,6 @@ from .PFA import PFAType
 from .RMA import RMAType
 from ..utils import snr_to_rniirs
 
-from sarpy.geometry import point_projection
 
 __classification__ = "UNCLASSIFIED"
 __author__ = "Thomas McCullough"
@@ -43,6 +42,82 @@ _SICD_SPECIFICATION_VERSION = '1.2'
 _SICD_SPECIFICATION_DATE = '2018-12-13T00:00:00Z'
 _SICD_SPECIFICATION_NAMESPACE = 'urn:SICD:1.2.1'
 
+# the SIDD 2.0 DES subheader details for SICD
+_DES_DETAILS = ordered_dict([
+    ('DESSHSI', _SICD_SPECIFICATION_IDENTIFIER),
+    ('DESSHSV', _SICD_SPECIFICATION_VERSION),
+    ('DESSHSD', _SICD_SPECIFICATION_DATE),
+    ('DESSHTN', _SICD_SPECIFICATION_NAMESPACE)])
+
+# conversion factor from decibels to the natural log scale, so that 10**(x/10.) = exp(x*_LN10_DIV_10)
+_LN10_DIV_10 = math.log(10.)/10.
+
+# immutable value types, for which a dictionary of them can be copied shallowly
+_SCALAR_TYPES = (str, bytes, float, bool, type(None)) + integer_types
+
+# the image formation algorithm parameter elements, of which no more than one should be populated
+_ALG_NAMES = ('RgAzComp', 'PFA', 'RMA')
+
+# attribute paths which must be populated to permit formulating a projection, in checking order
+_PROJECTION_REQUIRED_PATHS = tuple(
+    (attrgetter(the_path), the_path) for the_path in (
+        'GeoData', 'GeoData.SCP', 'GeoData.SCP.ECF',
+        'ImageData', 'ImageData.FirstRow', 'ImageData.FirstCol',
+        'ImageData.SCPPixel', 'ImageData.SCPPixel.Row', 'ImageData.SCPPixel.Col',
+        'Position', 'Position.ARPPoly',
+        'Grid', 'Grid.Row', 'Grid.Row.SS', 'Grid.Col', 'Grid.Col.SS', 'Grid.Type'))
+
+
+def _rcm_vehicle(collector):
+    return '{0:02d}'.format(int(collector[3:].replace('-', '')))
+
+
+# orbital revolutions per minute (revolutions per day over 1440 minutes)
+_CSK_REV_PER_MIN = 14.8125/1440.
+_RSAT_REV_PER_MIN = 14.292/1440.
+_TSX_REV_PER_MIN = 15.182/1440.
+
+# commercial collector naming details, in matching order, of the form
+#   (collector name, match rule, radar abbreviation, vehicle string or function, revolutions per minute)
+# where the match rule for the (stripped) collector name is one of 'exact', 'prefix' (case sensitive),
+# or 'iprefix' (case insensitive, against the given upper case name)
+_COLLECTOR_TABLE = (
+    ('CSK', 'prefix', 'CS', lambda collector: collector[3:5], _CSK_REV_PER_MIN),
+    ('RADARSAT-1', 'exact', 'RS', '01', _RSAT_REV_PER_MIN),
+    ('RADARSAT-2', 'exact', 'RS', '02', _RSAT_REV_PER_MIN),
+    ('RCM', 'prefix', 'RC', _rcm_vehicle, _RSAT_REV_PER_MIN),  # not sure what the rate should be here
+    ('SENTINEL', 'prefix', 'SE', lambda collector: collector[-2:], None),
+    ('S1', 'prefix', 'SE', lambda collector: collector[-2:], None),
+    ('TERRA', 'iprefix', 'TS', '01', _TSX_REV_PER_MIN),
+    ('TSX', 'iprefix', 'TS', '01', _TSX_REV_PER_MIN),
+    ('TAN', 'iprefix', 'TD', '01', _TSX_REV_PER_MIN),
+    ('TDX', 'iprefix', 'TD', '01', _TSX_REV_PER_MIN))
+
+
+def _collector_matches(collector, upper, name, rule):
+    """
+    Does the (stripped) collector name match the given collector table entry?
+
+    Parameters
+    ----------
+    collector : str
+    upper : str
+        the upper case collector name
+    name : str
+    rule : str
+
+    Returns
+    -------
+    bool
+    """
+
+    if rule == 'exact':
+        return collector == name
+    elif rule == 'prefix':
+        return collector.startswith(name)
+    else:
+        return upper.startswith(name)
+
 
 class SICDType(Serializable):
     """
@@ -56,7 +131,7 @@ class SICDType(Serializable):
     _required = (
         'CollectionInfo', 'ImageData', 'GeoData', 'Grid', 'Timeline', 'Position',
         'RadarCollection', 'ImageFormation', 'SCPCOA')
-    _choice = ({'required': False, 'collection': ('RgAzComp', 'PFA', 'RMA')}, )
+    _choice = ({'required': False, 'collection': _ALG_NAMES}, )
     # descriptors
     CollectionInfo = _SerializableDescriptor(
         'CollectionInfo', CollectionInfoType, _required, strict=False,
@@ -150,25 +225,27 @@ class SICDType(Serializable):
         if '_xml_ns_key' in kwargs:
             self._xml_ns_key = kwargs['_xml_ns_key']
         self._coa_projection = None
-        self.CollectionInfo = CollectionInfo
-        self.ImageCreation = ImageCreation
-        self.ImageData = ImageData
-        self.GeoData = GeoData
-        self.Grid = Grid
-        self.Timeline = Timeline
-        self.Position = Position
-        self.RadarCollection = RadarCollection
-        self.ImageFormation = ImageFormation
-        self.SCPCOA = SCPCOA
-        self.Radiometric = Radiometric
-        self.Antenna = Antenna
-        self.ErrorStatistics = ErrorStatistics
-        self.MatchInfo = MatchInfo
-        self.RgAzComp = RgAzComp
-        self.PFA = PFA
-        self.RMA = RMA
+        self._image_form_type = None
+        self._derived = False
+        values = (
+            CollectionInfo, ImageCreation, ImageData, GeoData, Grid, Timeline, Position,
+            RadarCollection, ImageFormation, SCPCOA, Radiometric, Antenna, ErrorStatistics,
+            MatchInfo, RgAzComp, PFA, RMA)
+        for attribute, value in zip(self._fields, values):
+            # an unset descriptor already yields None, so skip the setter entirely
+            if value is not None:
+                setattr(self, attribute, value)
         super(SICDType, self).__init__(**kwargs)
 
+    def __setattr__(self, key, value):
+        if key in self._fields:
+            # derived values may need to be populated again
+            object.__setattr__(self, '_derived', False)
+            if key in _ALG_NAMES:
+                # the image formation type may change, so drop the cached value
+                object.__setattr__(self, '_image_form_type', None)
+        super(SICDType, self).__setattr__(key, value)
+
     @property
     def coa_projection(self):
         """
@@ -189,10 +266,13 @@ class SICDType(Serializable):
         none of them are populated.
         """
 
-        for attribute in self._choice[0]['collection']:
-            if getattr(self, attribute) is not None:
-                return attribute
-        return 'OTHER'
+        if self._image_form_type is None:
+            self._image_form_type = 'OTHER'
+            for attribute in _ALG_NAMES:
+                if getattr(self, attribute) is not None:
+                    self._image_form_type = attribute
+                    break
+        return self._image_form_type
 
     def _validate_image_segment_id(self):  # type: () -> bool
         if self.ImageFormation is None or self.RadarCollection is None:
@@ -217,52 +297,49 @@ class SICDType(Serializable):
         else:
             if seg_list is None:
                 logging.error(
-                    'ImageFormation.SegmentIdentifier is populated as {}, but RadarCollection.Area.Plane.SegmentList '
-                    'is not populated.'.format(seg_id))
+                    'ImageFormation.SegmentIdentifier is populated as %s, but RadarCollection.Area.Plane.SegmentList '
+                    'is not populated.', seg_id)
                 return False
             else:
                 # let's double check that seg_id is sensibly populated
-                the_ids = [entry.Identifier for entry in seg_list]
-                if seg_id in the_ids:
+                if any(entry.Identifier == seg_id for entry in seg_list):
                     return True
                 else:
+                    the_ids = [entry.Identifier for entry in seg_list]
                     logging.error(
-                        'ImageFormation.SegmentIdentifier is populated as {}, but this is not one of the possible '
-                        'identifiers in the RadarCollection.Area.Plane.SegmentList definition {}. '
+                        'ImageFormation.SegmentIdentifier is populated as %s, but this is not one of the possible '
+                        'identifiers in the RadarCollection.Area.Plane.SegmentList definition %s. '
                         'ImageFormation.SegmentIdentifier should be set to identify the '
-                        'appropriate segment.'.format(seg_id, the_ids))
+                        'appropriate segment.', seg_id, the_ids)
                     return False
 
     def _validate_image_form(self):  # type: () -> bool
         if self.ImageFormation is None:
             logging.error(
-                'ImageFormation attribute is not populated, and ImageFormType is {}. This '
-                'cannot be valid.'.format(self.ImageFormType))
+                'ImageFormation attribute is not populated, and ImageFormType is %s. This '
+                'cannot be valid.', self.ImageFormType)
             return False  # nothing more to be done.
 
-        alg_types = []
-        for alg in ['RgAzComp', 'PFA', 'RMA']:
-            if getattr(self, alg) is not None:
-                alg_types.append(alg)
+        alg_types = [alg for alg in _ALG_NAMES if getattr(self, alg) is not None]
 
         if len(alg_types) > 1:
             logging.error(
-                'ImageFormation.ImageFormAlgo is set as {}, and multiple SICD image formation parameters {} are set. '
+                'ImageFormation.ImageFormAlgo is set as %s, and multiple SICD image formation parameters %s are set. '
                 'Only one image formation algorithm should be set, and ImageFormation.ImageFormAlgo '
-                'should match.'.format(self.ImageFormation.ImageFormAlgo, alg_types))
+                'should match.', self.ImageFormation.ImageFormAlgo, alg_types)
             return False
         elif len(alg_types) == 0:
             if self.ImageFormation.ImageFormAlgo is None:
                 # TODO: is this correct?
                 logging.warning(
                     'ImageFormation.ImageFormAlgo is not set, and there is no corresponding RgAzComp, PFA, or RMA '
-                    'SICD parameters set. Setting ImageFormAlgo to "OTHER".'.format(self.ImageFormation.ImageFormAlgo))
+                    'SICD parameters set. Setting ImageFormAlgo to "OTHER".')
                 self.ImageFormation.ImageFormAlgo = 'OTHER'
                 return True
             elif self.ImageFormation.ImageFormAlgo != 'OTHER':
                 logging.error(
                     'No RgAzComp, PFA, or RMA SICD parameters populated, but ImageFormation.ImageFormAlgo '
-                    'is set as {}.'.format(self.ImageFormation.ImageFormAlgo))
+                    'is set as %s.', self.ImageFormation.ImageFormAlgo)
                 return False
             return True
         else:
@@ -270,38 +347,40 @@ class SICDType(Serializable):
                 return True
             elif self.ImageFormation.ImageFormAlgo is None:
                 logging.warning(
-                    'Image formation algorithm(s) {} populated, but ImageFormation.ImageFormAlgo was not set. '
-                    'ImageFormation.ImageFormAlgo has been set.'.format(alg_types[0]))
+                    'Image formation algorithm(s) %s populated, but ImageFormation.ImageFormAlgo was not set. '
+                    'ImageFormation.ImageFormAlgo has been set.', alg_types[0])
                 self.ImageFormation.ImageFormAlgo = alg_types[0].upper()
                 return True
             else:  # they are different values
                 # TODO: is resetting it the correct decision?
                 logging.warning(
-                    'Only the image formation algorithm {} is populated, but ImageFormation.ImageFormAlgo '
-                    'was set as {}. ImageFormation.ImageFormAlgo has been '
-                    'changed.'.format(alg_types[0], self.ImageFormation.ImageFormAlgo))
+                    'Only the image formation algorithm %s is populated, but ImageFormation.ImageFormAlgo '
+                    'was set as %s. ImageFormation.ImageFormAlgo has been '
+                    'changed.', alg_types[0], self.ImageFormation.ImageFormAlgo)
                 self.ImageFormation.ImageFormAlgo = alg_types[0].upper()
                 return True
 
     def _validate_spotlight_mode(self):
-        if self.CollectionInfo is not None or self.CollectionInfo.RadarMode is not None \
-                or self.CollectionInfo.RadarMode.ModeType is not None:
+        if self.CollectionInfo is None or self.CollectionInfo.RadarMode is None:
+            return True
+        mode_type = self.CollectionInfo.RadarMode.ModeType
+        if mode_type is None:
             return True
 
         if self.Grid is None or self.Grid.TimeCOAPoly is None:
             return True
+        coefs = self.Grid.TimeCOAPoly.Coefs
+        is_scalar = (coefs.shape == (1, 1))
 
-        if self.CollectionInfo.RadarMode.ModeType == 'SPOTLIGHT' and \
-                self.Grid.TimeCOAPoly.Coefs.shape != (1, 1):
+        if mode_type == 'SPOTLIGHT' and not is_scalar:
             logging.error(
                 'CollectionInfo.RadarMode.ModeType is SPOTLIGHT, but the Grid.TimeCOAPoly '
-                'is not scalar - {}. This cannot be valid.'.format(self.Grid.TimeCOAPoly.Coefs))
+                'is not scalar - %s. This cannot be valid.', coefs)
             return False
-        elif self.Grid.TimeCOAPoly.Coefs.shape == (1, 1) and \
-                self.CollectionInfo.RadarMode.ModeType != 'SPOTLIGHT':
+        elif is_scalar and mode_type != 'SPOTLIGHT':
             logging.warning(
                 'The Grid.TimeCOAPoly is scalar, but the CollectionInfo.RadarMode.ModeType '
-                'is not SPOTLIGHT - {}. This is likely not valid.'.format(self.CollectionInfo.RadarMode.ModeType))
+                'is not SPOTLIGHT - %s. This is likely not valid.', mode_type)
             return True
         return True
 
@@ -357,16 +436,27 @@ class SICDType(Serializable):
         except AttributeError:
             pass
 
-    def derive(self):
+    def derive(self, force=False):
         """
         Populates any potential derived data in the SICD structure. This should get called after reading an XML,
         or as a user desires.
 
+        Repeated calls are a no-op, unless one of the top level elements has been reassigned in the interim.
+        Set `force=True` to derive again after modifying the contents of an element in place.
+
+        Parameters
+        ----------
+        force : bool
+            Derive all the fields, even if this has been previously done.
+
         Returns
         -------
         None
         """
 
+        if self._derived and not force:
+            return
+
         # Note that there is dependency in calling order between steps - don't naively rearrange the following.
         if self.SCPCOA is None:
             self.SCPCOA = SCPCOAType()
@@ -410,41 +500,16 @@ class SICDType(Serializable):
         im_form_algo = None
         if self.ImageFormation is not None and self.ImageFormation.ImageFormAlgo is not None:
             im_form_algo = self.ImageFormation.ImageFormAlgo.upper()
-        if im_form_algo == 'RGAZCOMP':
-            # Check Grid settings
-            if self.Grid is None:
-                self.Grid = GridType()
-            # noinspection PyProtectedMember
-            self.Grid._derive_rg_az_comp(self.GeoData, self.SCPCOA, self.RadarCollection, self.ImageFormation)
-
-            # Check RgAzComp settings
-            if self.RgAzComp is None:
-                self.RgAzComp = RgAzCompType()
-            # noinspection PyProtectedMember
-            self.RgAzComp._derive_parameters(self.Grid, self.Timeline, self.SCPCOA)
-        elif im_form_algo == 'PFA':
-            if self.PFA is None:
-                self.PFA = PFAType()
-            # noinspection PyProtectedMember
-            self.PFA._derive_parameters(self.Grid, self.SCPCOA, self.GeoData)
-
-            if self.Grid is not None:
-                # noinspection PyProtectedMember
-                self.Grid._derive_pfa(
-                    self.GeoData, self.RadarCollection, self.ImageFormation, self.Position, self.PFA)
-        elif im_form_algo == 'RMA':
-            if self.RMA is not None:
-                # noinspection PyProtectedMember
-                self.RMA._derive_parameters(self.SCPCOA, self.Position, self.RadarCollection, self.ImageFormation)
-            if self.Grid is not None:
-                # noinspection PyProtectedMember
-                self.Grid._derive_rma(self.RMA, self.GeoData, self.RadarCollection, self.ImageFormation, self.Position)
+        handler = _DERIVE_ALGO_STEPS.get(im_form_algo, None)
+        if handler is not None:
+            handler(self)
 
         self.define_geo_image_corners()
         self.define_geo_valid_data()
         if self.Radiometric is not None:
             # noinspection PyProtectedMember
             self.Radiometric._derive_parameters(self.Grid, self.SCPCOA)
+        self._derived = True
 
     def apply_reference_frequency(self, reference_frequency):
         """
@@ -483,8 +548,9 @@ class SICDType(Serializable):
     def can_project_coordinates(self):
         """
         Determines whether the necessary elements are populated to permit projection
-        between image and physical coordinates. If False, then the (first discovered)
-        reason why not will be logged at error level.
+        between image and physical coordinates. If False, then the reason why not
+        will be logged at error level. All unpopulated required elements are reported
+        together in a single message.
 
         Returns
         -------
@@ -494,137 +560,33 @@ class SICDType(Serializable):
         if self._coa_projection is not None:
             return True
 
-        # GeoData elements?
-        if self.GeoData is None:
-            logging.error('Formulating a projection is not feasible because GeoData is not populated.')
-            return False
-        if self.GeoData.SCP is None:
-            logging.error('Formulating a projection is not feasible because GeoData.SCP is not populated.')
-            return False
-        if self.GeoData.SCP.ECF is None:
-            logging.error('Formulating a projection is not feasible because GeoData.SCP.ECF is not populated.')
-            return False
-
-        # ImageData elements?
-        if self.ImageData is None:
-            logging.error('Formulating a projection is not feasible because ImageData is not populated.')
-            return False
-        if self.ImageData.FirstRow is None:
-            logging.error('Formulating a projection is not feasible because ImageData.FirstRow is not populated.')
-            return False
-        if self.ImageData.FirstCol is None:
-            logging.error('Formulating a projection is not feasible because ImageData.FirstCol is not populated.')
-            return False
-        if self.ImageData.SCPPixel is None:
-            logging.error('Formulating a projection is not feasible because ImageData.SCPPixel is not populated.')
-            return False
-        if self.ImageData.SCPPixel.Row is None:
-            logging.error('Formulating a projection is not feasible because ImageData.SCPPixel.Row is not populated.')
-            return False
-        if self.ImageData.SCPPixel.Col is None:
-            logging.error('Formulating a projection is not feasible because ImageData.SCPPixel.Col is not populated.')
-            return False
-
-        # Position elements?
-        if self.Position is None:
-            logging.error('Formulating a projection is not feasible because Position is not populated.')
-            return False
-        if self.Position.ARPPoly is None:
-            logging.error('Formulating a projection is not feasible because Position.ARPPoly is not populated.')
+        missing = []
+        for getter, the_path in _PROJECTION_REQUIRED_PATHS:
+            if missing and any(the_path.startswith(entry + '.') for entry in missing):
+                continue  # the parent element is already reported
+            try:
+                value = getter(self)
+            except AttributeError:
+                value = None  # an intermediate element is not populated
+            if value is None:
+                missing.append(the_path)
+        if len(missing) > 0:
+            logging.error(
+                'Formulating a projection is not feasible because the following are not populated: %s',
+                ', '.join(missing))
             return False
 
-        # Grid elements?
-        if self.Grid is None:
-            logging.error('Formulating a projection is not feasible because Grid is not populated.')
-            return False
         if self.Grid.TimeCOAPoly is None:
             logging.warning(
                 'Formulating a projection may be inaccurate, because Grid.TimeCOAPoly is not populated and '
                 'a constant approximation will be used.')
-        if self.Grid.Row is None:
-            logging.error('Formulating a projection is not feasible because Grid.Row is not populated.')
-            return False
-        if self.Grid.Row.SS is None:
-            logging.error('Formulating a projection is not feasible because Grid.Row.SS is not populated.')
-            return False
-        if self.Grid.Col is None:
-            logging.error('Formulating a projection is not feasible because Grid.Col is not populated.')
-            return False
-        if self.Grid.Col.SS is None:
-            logging.error('Formulating a projection is not feasible because Grid.Col.SS is not populated.')
-            return False
-        if self.Grid.Type is None:
-            logging.error('Formulating a projection is not feasible because Grid.Type is not populated.')
-            return False
 
         # specifics for Grid.Type value
-        if self.Grid.Type == 'RGAZIM':
-            if self.ImageFormation is None:
-                logging.error(
-                    'Formulating a projection is not feasible because Grid.Type = "RGAZIM", but '
-                    'ImageFormation is not populated.')
-                return False
-            if self.ImageFormation.ImageFormAlgo is None:
-                logging.error(
-                    'Formulating a projection is not feasible because Grid.Type = "RGAZIM", but '
-                    'ImageFormation.ImageFormAlgo is not populated.')
-                return False
-
-            if self.ImageFormation.ImageFormAlgo == 'PFA':
-                if self.PFA is None:
-                    logging.error(
-                        'ImageFormation.ImageFormAlgo is "PFA", but the PFA parameter is not populated. '
-                        'No projection can be done.')
-                    return False
-                if self.PFA.PolarAngPoly is None:
-                    logging.error(
-                        'ImageFormation.ImageFormAlgo is "PFA", but the PFA.PolarAngPoly parameter is not '
-                        'populated. No projection can be done.')
-                    return False
-                if self.PFA.SpatialFreqSFPoly is None:
-                    logging.error(
-                        'ImageFormation.ImageFormAlgo is "PFA", but the PFA.SpatialFreqSFPoly parameter is not '
-                        'populated. No projection can be done.')
-                    return False
-            elif self.ImageFormation.ImageFormAlgo == 'RGAZCOMP':
-                if self.RgAzComp is None:
-                    logging.error(
-                        'ImageFormation.ImageFormAlgo is "RGAZCOMP", but the RgAzComp parameter '
-                        'is not populated. '
-                        'No projection can be done.')
-                    return False
-                if self.RgAzComp.AzSF is None:
-                    logging.error(
-                        'ImageFormation.ImageFormAlgo is "RGAZCOMP", but the RgAzComp.AzSF '
-                        'parameter is not populated. '
-                        'No projection can be done.')
-                    return False
-            else:
-                logging.error(
-                    'Grid.Type = "RGAZIM", and got unhandled ImageFormation.ImageFormAlgo {}. '
-                    'No projection can be done.'.format(self.ImageFormation.ImageFormAlgo))
-                return False
-        elif self.Grid.Type == 'RGZERO':
-            if self.RMA is None or self.RMA.INCA is None:
-                logging.error(
-                    'Grid.Type is "RGZERO", but the RMA.INCA parameter is not populated. '
-                    'No projection can be done.')
-                return False
-            if self.RMA.INCA.R_CA_SCP is None or self.RMA.INCA.TimeCAPoly is None \
-                    or self.RMA.INCA.DRateSFPoly is None:
-                logging.error(
-                    'Grid.Type is "RGZERO", but the parameters R_CA_SCP, TimeCAPoly, or DRateSFPoly of '
-                    'RMA.INCA parameter are not populated. '
-                    'No projection can be done.')
-                return False
-        elif self.Grid.Type == ['XRGYCR', 'XCTYAT', 'PLANE']:
-            if self.Grid.Row.UVectECF is None or self.Grid.Col.UVectECF is None:
-                logging.error(
-                    'Grid.Type is one of ["XRGYCR", "XCTYAT", "PLANE"], but the UVectECF parameter of '
-                    'Grid.Row or Grid.Col is not populated. No projection can be formulated.')
-                return False
-        else:
-            logging.error('Unhandled Grid.Type {}, unclear how to formulate a projection.'.format(self.Grid.Type))
+        checker = _GRID_TYPE_PROJECTION_CHECKS.get(self.Grid.Type, None)
+        if checker is None:
+            logging.error('Unhandled Grid.Type %s, unclear how to formulate a projection.', self.Grid.Type)
+            return False
+        if not checker(self):
             return False
 
         logging.info('Consider calling sicd.define_coa_projection if the sicd structure is defined.')
@@ -661,6 +623,8 @@ class SICDType(Serializable):
         if self._coa_projection is not None and not overide:
             return
 
+        # NB: imported here to avoid the import cost for metadata only usage
+        from sarpy.geometry import point_projection
         self._coa_projection = point_projection.COAProjection(
             self, delta_arp=delta_arp, delta_varp=delta_varp, range_bias=range_bias,
             adj_params_frame=adj_params_frame)
@@ -691,7 +655,7 @@ class SICDType(Serializable):
         sarpy.geometry.point_projection.ground_to_image
         """
 
-        kwargs['use_sicd_coa'] = True
+        from sarpy.geometry import point_projection
         return point_projection.ground_to_image(coords, self, **kwargs)
 
     def project_ground_to_image_geo(self, coords, ordering='latlong', **kwargs):
@@ -724,7 +688,7 @@ class SICDType(Serializable):
         sarpy.geometry.point_projection.ground_to_image_geo
         """
 
-        kwargs['use_sicd_coa'] = True
+        from sarpy.geometry import point_projection
         return point_projection.ground_to_image_geo(coords, self, ordering=ordering, **kwargs)
 
     def project_image_to_ground(self, im_points, projection_type='HAE', **kwargs):
@@ -751,7 +715,7 @@ class SICDType(Serializable):
         sarpy.geometry.point_projection.image_to_ground
         """
 
-        kwargs['use_sicd_coa'] = True
+        from sarpy.geometry import point_projection
         return point_projection.image_to_ground(
             im_points, self, projection_type=projection_type, **kwargs)
 
@@ -781,7 +745,7 @@ class SICDType(Serializable):
         sarpy.geometry.point_projection.image_to_ground_geo
         """
 
-        kwargs['use_sicd_coa'] = True
+        from sarpy.geometry import point_projection
         return point_projection.image_to_ground_geo(
             im_points, self, ordering=ordering, projection_type=projection_type, **kwargs)
 
@@ -802,17 +766,17 @@ class SICDType(Serializable):
         None
         """
 
-        if self.CollectionInfo is None:
+        collection_info = self.CollectionInfo
+        if collection_info is None:
             logging.error('CollectionInfo must not be None. Nothing to be done.')
             return
 
-        if self.CollectionInfo.Parameters is not None and \
-                self.CollectionInfo.Parameters.get('PREDICTED_RNIIRS', None) is not None:
-            if override:
-                logging.warning('PREDICTED_RNIIRS already populated, and this value will be overridden.')
-            else:
+        params = collection_info.Parameters
+        if params is not None and 'PREDICTED_RNIIRS' in params:
+            if not override:
                 logging.info('PREDICTED_RNIIRS already populated. Nothing to be done.')
                 return
+            logging.warning('PREDICTED_RNIIRS already populated, and this value will be overridden.')
 
         if noise is None:
             try:
@@ -821,49 +785,47 @@ class SICDType(Serializable):
                         'Radiometric.NoiseLevel.NoiseLevelType must be "ABSOLUTE" to estimate noise. '
                         'You must provide a noise estimate.')
                     return
-                noise = self.Radiometric.NoiseLevel.NoisePoly(0, 0)  # this is in db
-                noise = 10**(noise/10.)  # this is absolute
+                # NB: the value at the origin is simply the constant coefficient
+                noise = float(self.Radiometric.NoiseLevel.NoisePoly.Coefs[0, 0])  # this is in db
+                noise = math.exp(noise*_LN10_DIV_10)  # this is absolute
 
                 # convert to SigmaZero value
-                noise *= self.Radiometric.SigmaZeroSFPoly(0, 0)  # TODO: is this no longer in db now?
+                noise *= float(self.Radiometric.SigmaZeroSFPoly.Coefs[0, 0])  # TODO: is this no longer in db now?
             except Exception as e:
-                logging.error('Encountered an error estimating noise. {}'.format(e))
+                logging.error('Encountered an error estimating noise. %s', e)
                 return
 
         if signal is None:
-            try:
-                # use 1.0 for copolar collection and 0.25 from cross-polar collection
-                pol = self.ImageFormation.TxRcvPolarizationProc
-                if pol is None or ':' not in pol:
-                    signal = 0.25
-                else:
-                    pols = pol.split(':')
-                    if pols[0] == pols[1]:
-                        signal = 1.0
-                    else:
-                        signal = 0.25
-            except Exception:
-                signal = 0.25
+            # use 1.0 for copolar collection and 0.25 from cross-polar collection
+            pol = None if self.ImageFormation is None else self.ImageFormation.TxRcvPolarizationProc
+            # NB: compare the transmit and receive parts in place, without splitting
+            idx = -1 if pol is None else pol.find(':')
+            signal = 1.0 if idx > 0 and pol[:idx] == pol[idx+1:] else 0.25
 
         try:
             bw_area = abs(self.Grid.Row.ImpRespBW*self.Grid.Col.ImpRespBW*
-                          numpy.cos(numpy.deg2rad(self.SCPCOA.SlopeAng)))
+                          math.cos(math.radians(self.SCPCOA.SlopeAng)))
         except Exception as e:
-            logging.error('Encountered an error estimating bandwidth area. {}'.format(e))
+            logging.error('Encountered an error estimating bandwidth area. %s', e)
             return
 
         inf_density, rniirs = snr_to_rniirs(bw_area, signal, noise)
-        logging.info('Calculated INFORMATION_DENSITY = {0:0.5G}, '
-                     'PREDICTED_RNIIRS = {1:0.5G}'.format(inf_density, rniirs))
-        if self.CollectionInfo.Parameters is None:
-            self.CollectionInfo.Parameters = []  # initialize
-        self.CollectionInfo.Parameters['INFORMATION_DENSITY'] = '{0:0.2G}'.format(inf_density)
-        self.CollectionInfo.Parameters['PREDICTED_RNIIRS'] = '{0:0.1f}'.format(rniirs)
+        logging.info('Calculated INFORMATION_DENSITY = %0.5G, '
+                     'PREDICTED_RNIIRS = %0.5G', inf_density, rniirs)
+        if params is None:
+            collection_info.Parameters = []  # initialize
+            params = collection_info.Parameters
+        params['INFORMATION_DENSITY'] = '{0:0.2G}'.format(inf_density)
+        params['PREDICTED_RNIIRS'] = '{0:0.1f}'.format(rniirs)
 
     def copy(self):
         out = super(SICDType, self).copy()
         if hasattr(self, '_NITF'):
-            out._NITF = copy.deepcopy(self._NITF)
+            nitf = self._NITF
+            if isinstance(nitf, dict) and all(isinstance(value, _SCALAR_TYPES) for value in nitf.values()):
+                out._NITF = nitf.copy()  # NB: the typical flat dictionary, preserving the dict subclass
+            else:
+                out._NITF = copy.deepcopy(nitf)
         return out
 
     def get_suggested_name(self, product_number=1):
@@ -875,58 +837,42 @@ class SICDType(Serializable):
         str
         """
 
-        def get_commercial_id(prod):
-            _cdate_str = cdate.strftime('%d%b%y')
+        def get_commercial_id(prod, _cdate_str, _mins):
             _collector = self.CollectionInfo.CollectorName.strip()
-            _mins = cdate.hour * 60 + cdate.minute + cdate.second / 60.
-            if _collector.startswith('CSK'):
-                _crad = 'CS'
-                _cvehicle = _collector[3:5]
-                _pass = '{0:02d}'.format(int(round(_mins*14.8125/1440.)))
-            elif _collector in ('RADARSAT-1', 'RADARSAT-2'):
-                _crad = 'RS'
-                _cvehicle = '0'+_collector[-1]
-                _pass = '{0:02d}'.format(int(round(_mins*14.292/1440.)))
-            elif _collector.startswith('RCM'):
-                _crad = 'RC'
-                _cvehicle = '{0:02d}'.format(int(re.sub('-', '', _collector[3:])))
-                _pass = '{0:02d}'.format(int(round(_mins*14.292/1440.)))  # not sure what to put here
-            elif _collector.startswith('SENTINEL') or _collector.startswith('S1'):
-                _crad = 'SE'
-                _cvehicle = self.CollectionInfo.CollectorName[-2:]
-                _pass = '00'
-            elif _collector.lower().startswith('terra') or _collector.lower().startswith('tsx'):
-                _crad = 'TS'
-                _cvehicle = '01'
-                _pass = '{0:02d}'.format(int(round(_mins*15.182/1440.)))
-            elif _collector.lower().startswith('tan') or _collector.lower().startswith('tdx'):
-                _crad = 'TD'
-                _cvehicle = '01'
-                _pass = '{0:02d}'.format(int(round(_mins*15.182/1440.)))
+            _upper = _collector.upper()
+            entry = next(
+                (the_entry for the_entry in _COLLECTOR_TABLE
+                 if _collector_matches(_collector, _upper, the_entry[0], the_entry[1])), None)
+            if entry is None:
+                logging.error('Got unknown collector %s. Setting collector vehicle to 00.', _collector)
+                _crad, _cvehicle, _pass = 'UN', '00', '00'
             else:
-                logging.error('Got unknown collector {}. Setting collector vehicle to 00.'.format(_collector))
-                _crad = 'UN'
-                _cvehicle = '00'
-                _pass = '00'
-
-            return '{0:s}{1:s}{2:s}{3:s}{4:03d}'.format(_cdate_str, _crad, _cvehicle, _pass, prod)
-
-        def get_vendor_id():
-            _time_str = cdate.strftime('%H%M%S')
-            _mode = '{}{}{}'.format(self.CollectionInfo.RadarMode.get_mode_abbreviation(),
-                                    self.Grid.get_resolution_abbreviation(),
-                                    self.SCPCOA.SideOfTrack)
-            _coords = self.GeoData.SCP.get_image_center_abbreviation()
-            _freq_band = self.RadarCollection.TxFrequency.get_band_abbreviation()
-            _pol = '{}{}'.format(
+                _, _, _crad, _cvehicle, rate = entry
+                if callable(_cvehicle):
+                    _cvehicle = _cvehicle(_collector)
+                _pass = '00' if rate is None else '{0:02d}'.format(int(round(_mins*rate)))
+
+            return _cdate_str + _crad + _cvehicle + _pass + '{0:03d}'.format(prod)
+
+        def get_vendor_id(_time_str):
+            # NB: a single format call for the whole vendor id
+            return '_{}_{}{}{}_{}_001{}_{}{}_0101_SPY'.format(
+                _time_str,
+                self.CollectionInfo.RadarMode.get_mode_abbreviation(),
+                self.Grid.get_resolution_abbreviation(),
+                self.SCPCOA.SideOfTrack,
+                self.GeoData.SCP.get_image_center_abbreviation(),
+                self.RadarCollection.TxFrequency.get_band_abbreviation(),
                 self.RadarCollection.get_polarization_abbreviation(),
                 self.ImageFormation.get_polarization_abbreviation())
-            return '_{}_{}_{}_001{}_{}_0101_SPY'.format(_time_str, _mode, _coords, _freq_band, _pol)
 
         cdate = self.Timeline.CollectStart.astype(datetime)
+        # NB: a single strftime call, sliced into the date and time pieces
+        date_time_str = cdate.strftime('%d%b%y%H%M%S')
+        mins = cdate.hour*60 + cdate.minute + cdate.second/60.
 
         try:
-            return get_commercial_id(product_number) + get_vendor_id()
+            return get_commercial_id(product_number, date_time_str[:-6], mins) + get_vendor_id(date_time_str[-6:])
         except AttributeError:
             logging.error('Failed to construct suggested name.')
             return None
@@ -941,12 +887,210 @@ class SICDType(Serializable):
         dict
         """
 
-        return OrderedDict([
-            ('DESSHSI', _SICD_SPECIFICATION_IDENTIFIER),
-            ('DESSHSV', _SICD_SPECIFICATION_VERSION),
-            ('DESSHSD', _SICD_SPECIFICATION_DATE),
-            ('DESSHTN', _SICD_SPECIFICATION_NAMESPACE)])
+        # NB: callers populate further entries, so hand out a copy
+        return _DES_DETAILS.copy()
 
     def to_xml_bytes(self, urn=None, tag=None, check_validity=False, strict=DEFAULT_STRICT):
         return super(SICDType, self).to_xml_bytes(
             urn=_SICD_SPECIFICATION_NAMESPACE, tag=tag, check_validity=check_validity, strict=strict)
+
+
+#########
+# Grid.Type specific checks for the feasibility of formulating a projection
+
+def _can_project_rgazim(sicd):
+    """
+    Checks the image formation specific elements required for projection when Grid.Type is "RGAZIM".
+
+    Parameters
+    ----------
+    sicd : SICDType
+
+    Returns
+    -------
+    bool
+    """
+
+    if sicd.ImageFormation is None:
+        logging.error(
+            'Formulating a projection is not feasible because Grid.Type = "RGAZIM", but '
+            'ImageFormation is not populated.')
+        return False
+    if sicd.ImageFormation.ImageFormAlgo is None:
+        logging.error(
+            'Formulating a projection is not feasible because Grid.Type = "RGAZIM", but '
+            'ImageFormation.ImageFormAlgo is not populated.')
+        return False
+
+    if sicd.ImageFormation.ImageFormAlgo == 'PFA':
+        if sicd.PFA is None:
+            logging.error(
+                'ImageFormation.ImageFormAlgo is "PFA", but the PFA parameter is not populated. '
+                'No projection can be done.')
+            return False
+        if sicd.PFA.PolarAngPoly is None:
+            logging.error(
+                'ImageFormation.ImageFormAlgo is "PFA", but the PFA.PolarAngPoly parameter is not '
+                'populated. No projection can be done.')
+            return False
+        if sicd.PFA.SpatialFreqSFPoly is None:
+            logging.error(
+                'ImageFormation.ImageFormAlgo is "PFA", but the PFA.SpatialFreqSFPoly parameter is not '
+                'populated. No projection can be done.')
+            return False
+    elif sicd.ImageFormation.ImageFormAlgo == 'RGAZCOMP':
+        if sicd.RgAzComp is None:
+            logging.error(
+                'ImageFormation.ImageFormAlgo is "RGAZCOMP", but the RgAzComp parameter '
+                'is not populated. '
+                'No projection can be done.')
+            return False
+        if sicd.RgAzComp.AzSF is None:
+            logging.error(
+                'ImageFormation.ImageFormAlgo is "RGAZCOMP", but the RgAzComp.AzSF '
+                'parameter is not populated. '
+                'No projection can be done.')
+            return False
+    else:
+        logging.error(
+            'Grid.Type = "RGAZIM", and got unhandled ImageFormation.ImageFormAlgo %s. '
+            'No projection can be done.', sicd.ImageFormation.ImageFormAlgo)
+        return False
+    return True
+
+
+def _can_project_rgzero(sicd):
+    """
+    Checks the RMA specific elements required for projection when Grid.Type is "RGZERO".
+
+    Parameters
+    ----------
+    sicd : SICDType
+
+    Returns
+    -------
+    bool
+    """
+
+    if sicd.RMA is None or sicd.RMA.INCA is None:
+        logging.error(
+            'Grid.Type is "RGZERO", but the RMA.INCA parameter is not populated. '
+            'No projection can be done.')
+        return False
+    if sicd.RMA.INCA.R_CA_SCP is None or sicd.RMA.INCA.TimeCAPoly is None \
+            or sicd.RMA.INCA.DRateSFPoly is None:
+        logging.error(
+            'Grid.Type is "RGZERO", but the parameters R_CA_SCP, TimeCAPoly, or DRateSFPoly of '
+            'RMA.INCA parameter are not populated. '
+            'No projection can be done.')
+        return False
+    return True
+
+
+def _can_project_plane(sicd):
+    """
+    Checks the elements required for projection when Grid.Type is one of "XRGYCR", "XCTYAT", or "PLANE".
+
+    Parameters
+    ----------
+    sicd : SICDType
+
+    Returns
+    -------
+    bool
+    """
+
+    if sicd.Grid.Row.UVectECF is None or sicd.Grid.Col.UVectECF is None:
+        logging.error(
+            'Grid.Type is one of ["XRGYCR", "XCTYAT", "PLANE"], but the UVectECF parameter of '
+            'Grid.Row or Grid.Col is not populated. No projection can be formulated.')
+        return False
+    return True
+
+
+_GRID_TYPE_PROJECTION_CHECKS = {
+    'RGAZIM': _can_project_rgazim,
+    'RGZERO': _can_project_rgzero,
+    'XRGYCR': _can_project_plane,
+    'XCTYAT': _can_project_plane,
+    'PLANE': _can_project_plane}
+
+
+#########
+# image formation algorithm specific steps for SICDType.derive()
+
+def _derive_rgazcomp(sicd):
+    """
+    Derive the Grid and RgAzComp parameters for a RGAZCOMP image formation algorithm.
+
+    Parameters
+    ----------
+    sicd : SICDType
+
+    Returns
+    -------
+    None
+    """
+
+    # Check Grid settings
+    if sicd.Grid is None:
+        sicd.Grid = GridType()
+    # noinspection PyProtectedMember
+    sicd.Grid._derive_rg_az_comp(sicd.GeoData, sicd.SCPCOA, sicd.RadarCollection, sicd.ImageFormation)
+
+    # Check RgAzComp settings
+    if sicd.RgAzComp is None:
+        sicd.RgAzComp = RgAzCompType()
+    # noinspection PyProtectedMember
+    sicd.RgAzComp._derive_parameters(sicd.Grid, sicd.Timeline, sicd.SCPCOA)
+
+
+def _derive_pfa(sicd):
+    """
+    Derive the PFA and Grid parameters for a PFA image formation algorithm.
+
+    Parameters
+    ----------
+    sicd : SICDType
+
+    Returns
+    -------
+    None
+    """
+
+    if sicd.PFA is None:
+        sicd.PFA = PFAType()
+    # noinspection PyProtectedMember
+    sicd.PFA._derive_parameters(sicd.Grid, sicd.SCPCOA, sicd.GeoData)
+
+    if sicd.Grid is not None:
+        # noinspection PyProtectedMember
+        sicd.Grid._derive_pfa(
+            sicd.GeoData, sicd.RadarCollection, sicd.ImageFormation, sicd.Position, sicd.PFA)
+
+
+def _derive_rma(sicd):
+    """
+    Derive the RMA and Grid parameters for a RMA image formation algorithm.
+
+    Parameters
+    ----------
+    sicd : SICDType
+
+    Returns
+    -------
+    None
+    """
+
+    if sicd.RMA is not None:
+        # noinspection PyProtectedMember
+        sicd.RMA._derive_parameters(sicd.SCPCOA, sicd.Position, sicd.RadarCollection, sicd.ImageFormation)
+    if sicd.Grid is not None:
+        # noinspection PyProtectedMember
+        sicd.Grid._derive_rma(sicd.RMA, sicd.GeoData, sicd.RadarCollection, sicd.ImageFormation, sicd.Position)
+
+
+_DERIVE_ALGO_STEPS = {
+    'RGAZCOMP': _derive_rgazcomp,
+    'PFA': _derive_pfa,
+    'RMA': _derive_rma}
@@ -28,6 +28,11 @@ if sys.version_info[0] < 3:
     # noinspection PyUnresolvedReferences
     string_types = (str, unicode)
 
+# the built-in dict preserves insertion order as of Python 3.7, and is cheaper to construct
+ordered_dict = dict
+if sys.version_info[:2] < (3, 7):
+    ordered_dict = OrderedDict
+
 __classification__ = "UNCLASSIFIED"
 __author__ = "Thomas McCullough"
 
@@ -119,6 +124,25 @@ def _create_text_node(doc, tag, value, parent=None):
     return node
 
 
+def _element_to_bytes(element):
+    """XML ElementTree serialization helper function.
+
+    Parameters
+    ----------
+    element : ElementTree.Element
+
+    Returns
+    -------
+    bytes
+        The utf-8 encoded xml, without xml declaration.
+    """
+
+    if sys.version_info[0] < 3:
+        return ElementTree.tostring(element, encoding='utf-8', method='xml')
+    # NB: serializing to text, then encoding once, avoids a codec round trip for every write
+    return ElementTree.tostring(element, encoding='unicode', method='xml').encode('utf-8')
+
+
 def _find_first_child(node, tag, xml_ns, ns_key):
     if xml_ns is None:
         return node.find(tag)
@@ -178,6 +202,34 @@ def _parse_bool(value, name, instance):
             name, instance.__class__.__name__, type(value)))
 
 
+_NOT_GIVEN = object()
+
+
+def _set_xml_ns(instance, kwargs):
+    """
+    Pops the `_xml_ns` and `_xml_ns_key` entries (if present) from the constructor
+    keyword arguments dictionary, and sets them on the instance. Using pop requires
+    only one lookup per key, and leaves nothing for the base constructor to inspect.
+
+    Parameters
+    ----------
+    instance : Serializable
+    kwargs : dict
+        the constructor keyword arguments, which will be modified
+
+    Returns
+    -------
+    None
+    """
+
+    xml_ns = kwargs.pop('_xml_ns', _NOT_GIVEN)
+    if xml_ns is not _NOT_GIVEN:
+        instance._xml_ns = xml_ns
+    xml_ns_key = kwargs.pop('_xml_ns_key', _NOT_GIVEN)
+    if xml_ns_key is not _NOT_GIVEN:
+        instance._xml_ns_key = xml_ns_key
+
+
 def _parse_int(value, name, instance):
     # it is assumed that None is handled before this
     if isinstance(value, integer_types):
@@ -411,7 +463,7 @@ def _parse_parameters_collection(value, name, instance):
     if isinstance(value, dict):
         return value
     elif isinstance(value, list):
-        out = OrderedDict()
+        out = ordered_dict()
         if len(value) == 0:
             return out
         if isinstance(value[0], ElementTree.Element):
@@ -518,12 +570,12 @@ class _BasicDescriptor(object):
         fetched = self.data.get(instance, self.default_value)
         if fetched is not None or not self.required:
             return fetched
+        elif self.strict:
+            raise AttributeError(
+                'Required field {} of class {} is not populated.'.format(self.name, instance.__class__.__name__))
         else:
-            msg = 'Required field {} of class {} is not populated.'.format(self.name, instance.__class__.__name__)
-            if self.strict:
-                raise AttributeError(msg)
-            else:
-                logging.debug(msg)  # NB: this is at debug level to not be too verbose
+            # NB: this is at debug level to not be too verbose, so defer the formatting to logging
+            logging.debug('Required field %s of class %s is not populated.', self.name, instance.__class__.__name__)
             return fetched
 
     def __set__(self, instance, value):
@@ -556,8 +608,8 @@ class _BasicDescriptor(object):
                         'None.'.format(self.name, instance.__class__.__name__))
                 else:
                     logging.debug(  # NB: this is at debuglevel to not be too verbose
-                        'Required attribute {} of class {} has been set to None.'.format(
-                            self.name, instance.__class__.__name__))
+                        'Required attribute %s of class %s has been set to None.',
+                        self.name, instance.__class__.__name__)
             self.data[instance] = None
             return True
         # note that the remainder must be implemented in each extension
@@ -639,9 +691,10 @@ class _StringEnumDescriptor(_BasicDescriptor):
 
     def __init__(self, name, values, required, strict=DEFAULT_STRICT, default_value=None, docstring=None):
         self.values = values
+        self._value_set = frozenset(values)  # for constant time membership checks
         super(_StringEnumDescriptor, self).__init__(
             name, required, strict=strict, default_value=default_value, docstring=docstring)
-        if (self.default_value is not None) and (self.default_value not in self.values):
+        if (self.default_value is not None) and (self.default_value not in self._value_set):
             self.default_value = None
 
     def _docstring_suffix(self):
@@ -660,7 +713,7 @@ class _StringEnumDescriptor(_BasicDescriptor):
 
         val = _parse_str(value, self.name, instance)
 
-        if val in self.values:
+        if val in self._value_set:
             self.data[instance] = val
         else:
             msg = 'Attribute {} of class {} received {}, but values ARE REQUIRED to be ' \
@@ -1310,7 +1363,10 @@ class Serializable(object):
     This is important for SIDD handling, but not required for SICD handling.
     """
 
-    # NB: it may be good practice to use __slots__ to further control class functionality?
+    __slots__ = ('__weakref__', '_xml_ns', '_xml_ns_key')
+    # NB: the weak reference slot is required, since the descriptors key their data
+    #   on the instance through a WeakKeyDictionary. Extensions which do not declare
+    #   __slots__ themselves will still have an instance __dict__.
 
     def __init__(self, **kwargs):
         """
@@ -1324,6 +1380,10 @@ class Serializable(object):
             the keyword arguments dictionary - the possible entries match the attributes.
         """
 
+        if not kwargs:
+            # the typical case for a subclass constructor which already set its fields
+            return
+
         if '_xml_ns' in kwargs:
             self._xml_ns = kwargs['_xml_ns']
         unexpected_args = [key for key in kwargs if key not in self._fields and key[0] != '_']
@@ -1348,13 +1408,35 @@ class Serializable(object):
         return '{}(**{})'.format(self.__class__.__name__, self.to_dict(check_validity=False))
 
     def __setattr__(self, key, value):
-        if not (key.startswith('_') or (key in self._fields) or hasattr(self.__class__, key) or hasattr(self, key)):
+        # NB: check the class level _fields first, since field assignment is by far the most frequent case
+        if not ((key in self._fields) or key.startswith('_') or hasattr(self.__class__, key) or hasattr(self, key)):
             # not expected attribute - descriptors, properties, etc
             logging.warning(
                 'Class {} instance receiving unexpected attribute {}.\n'
                 '\tEnsure that this is not a typo of an expected field name.'.format(self.__class__.__name__, key))
         object.__setattr__(self, key, value)
 
+    def __deepcopy__(self, memo):
+        # NB: the field values are held by the descriptors, not in the instance __dict__,
+        #   so the default deepcopy behavior would silently drop them all.
+        out = self.__class__.__new__(self.__class__)
+        memo[id(self)] = out
+        for key, value in getattr(self, '__dict__', {}).items():
+            object.__setattr__(out, key, copy.deepcopy(value, memo))
+        for the_class in self.__class__.__mro__:
+            for key in the_class.__dict__.get('__slots__', ()):
+                if key != '__weakref__' and hasattr(self, key):
+                    object.__setattr__(out, key, copy.deepcopy(getattr(self, key), memo))
+        for attribute in self._fields:
+            descriptor = getattr(self.__class__, attribute, None)
+            if not isinstance(descriptor, _BasicDescriptor):
+                continue  # read only properties, etc
+            value = descriptor.data.get(self, None)
+            if value is not None:
+                # the value is already of the correct type, so bypass the setter coercion
+                descriptor.data[out] = copy.deepcopy(value, memo)
+        return out
+
     def set_numeric_format(self, attribute, format_string):
         """Sets the numeric format string for the given attribute.
 
@@ -1442,10 +1524,7 @@ class Serializable(object):
             required = entry.get('required', False)
             collect = entry['collection']
             # verify that no more than one of the entries in collect is set.
-            present = []
-            for attribute in collect:
-                if getattr(self, attribute) is not None:
-                    present.append(attribute)
+            present = [attribute for attribute in collect if getattr(self, attribute) is not None]
             if len(present) == 0 and required:
                 logging.error(
                     "Class {} requires that exactly one of the attributes {} is set, but none are "
@@ -1795,7 +1874,7 @@ class Serializable(object):
 
         Returns
         -------
-        OrderedDict
+        dict
             dict representation of class instance appropriate for direct json serialization.
         """
 
@@ -1860,7 +1939,7 @@ class Serializable(object):
                     raise ValueError(msg)
                 logging.warning(msg)
 
-        out = OrderedDict()
+        out = ordered_dict()
 
         for attribute in self._fields:
             if attribute in exclude:
@@ -1940,7 +2019,7 @@ class Serializable(object):
                 node.attrib[key] = urn[key]
         else:
             raise TypeError('Expected string or dictionary of string for urn, got type {}'.format(type(urn)))
-        return ElementTree.tostring(node, encoding='utf-8', method='xml')
+        return _element_to_bytes(node)
 
     def to_xml_string(self, urn=None, tag=None, check_validity=False, strict=DEFAULT_STRICT):
         """
@@ -1975,6 +2054,7 @@ class Serializable(object):
 
 class Arrayable(object):
     """Abstract class specifying basic functionality for assigning from/to an array"""
+    __slots__ = ()
 
     @classmethod
     def from_array(cls, array):
@@ -2298,6 +2378,9 @@ class ParametersCollection(object):
 
         self.set_collection(collection)
 
+    def __contains__(self, key):
+        return self._dict is not None and key in self._dict
+
     def __delitem__(self, key):
         if self._dict is not None:
             del self._dict[key]
@@ -2314,7 +2397,7 @@ class ParametersCollection(object):
             raise ValueError('Parameter name must be of type str, got {}'.format(type(value)))
 
         if self._dict is None:
-            self._dict = OrderedDict()
+            self._dict = ordered_dict()
         self._dict[name] = value
 
     def get(self, key, default=None):
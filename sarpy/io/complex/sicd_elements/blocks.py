@@ -4,14 +4,15 @@ Basic building blocks for SICD standard.
 """
 
 import sys
-from collections import OrderedDict
+from operator import attrgetter
+from xml.etree import ElementTree
 
 import numpy
 
-from .base import _get_node_value, _create_text_node, _create_new_node, _find_children, \
+from .base import _get_node_value, _create_new_node, _find_children, \
     Serializable, Arrayable, DEFAULT_STRICT, \
     _StringEnumDescriptor, _IntegerDescriptor, _FloatDescriptor, _FloatModularDescriptor, \
-    _SerializableDescriptor, int_func
+    _SerializableDescriptor, _set_xml_ns, int_func, ordered_dict
 
 
 __classification__ = "UNCLASSIFIED"
@@ -34,8 +35,75 @@ DUAL_POLARIZATION_VALUES = (
 # Geographical coordinates
 
 
+def _coerce_array(array, length):
+    """
+    Validates the array type input for the `from_array` methods of the point types, and
+    converts it to a list or tuple of (at least) `length` entries. Numpy arrays are converted
+    using :meth:`numpy.ndarray.tolist`, which yields native python scalars in a single call.
+
+    Parameters
+    ----------
+    array : numpy.ndarray|list|tuple
+    length : int
+        the minimum required length
+
+    Returns
+    -------
+    list|tuple
+    """
+
+    if isinstance(array, numpy.ndarray):
+        array = array.tolist()
+    elif not isinstance(array, (list, tuple)):
+        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+    if len(array) < length:
+        raise ValueError('Expected array to be of length {}, and received {}'.format(length, array))
+    return array
+
+
+def _construct_unchecked(the_type, fields, rows):
+    """
+    Constructs instances of `the_type` by directly populating the descriptor storage,
+    which bypasses the constructor and the setter parsing and validation. This is only
+    performed if `fields` is the complete collection of fields for `the_type`, and all
+    of those are float or integer descriptors without bounds, otherwise `None` is returned.
+
+    .. Note:: the values in `rows` must already be native python floats or integers,
+        matching the descriptor types. This is for internal use on trusted arrays only.
+
+    Parameters
+    ----------
+    the_type : type
+    fields : tuple
+    rows : list
+        list of the form `[[value for each field], ...]`
+
+    Returns
+    -------
+    None|list
+    """
+
+    if the_type._fields != fields:
+        return None
+    storage = []
+    for field in fields:
+        descriptor = getattr(the_type, field)
+        if type(descriptor) not in (_FloatDescriptor, _IntegerDescriptor) or descriptor.bounds is not None:
+            return None
+        storage.append(descriptor.data)
+
+    items = []
+    for row in rows:
+        item = the_type.__new__(the_type)
+        for data, value in zip(storage, row):
+            data[item] = value
+        items.append(item)
+    return items
+
+
 class XYZType(Serializable, Arrayable):
     """A spatial point in ECF coordinates."""
+    __slots__ = ()
     _fields = ('X', 'Y', 'Z')
     _required = _fields
     _numeric_format = {'X': '0.16G', 'Y': '0.16G', 'Z': '0.16G'}
@@ -60,10 +128,7 @@ class XYZType(Serializable, Arrayable):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.X, self.Y, self.Z = X, Y, Z
         super(XYZType, self).__init__(**kwargs)
 
@@ -84,11 +149,8 @@ class XYZType(Serializable, Arrayable):
 
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 3:
-                raise ValueError('Expected array to be of length 3, and received {}'.format(array))
-            return cls(X=array[0], Y=array[1], Z=array[2])
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 3)
+        return cls(X=values[0], Y=values[1], Z=values[2])
 
     def get_array(self, dtype=numpy.float64):
         """
@@ -105,11 +167,66 @@ class XYZType(Serializable, Arrayable):
             array of the form [X,Y,Z]
         """
 
-        return numpy.array([self.X, self.Y, self.Z], dtype=dtype)
+        out = numpy.empty((3, ), dtype=dtype)
+        out[0], out[1], out[2] = self.X, self.Y, self.Z
+        return out
+
+    @classmethod
+    def bulk_to_array(cls, points, dtype=numpy.float64):
+        """
+        Gets an array representation of a collection of instances, in a single
+        allocation.
+
+        Parameters
+        ----------
+        points : list|tuple
+            collection of XYZType instances
+        dtype : numpy.dtype
+            numpy data type of the return
+
+        Returns
+        -------
+        numpy.ndarray
+            array of shape `(N, 3)`, where each row is of the form [X, Y, Z]
+        """
+
+        getter = attrgetter('X', 'Y', 'Z')
+        out = numpy.array([getter(entry) for entry in points], dtype=dtype)
+        if out.size == 0:
+            return numpy.empty((0, 3), dtype=dtype)
+        return out
+
+    @classmethod
+    def bulk_from_array(cls, array):
+        """
+        Create a list of instances from an array of shape `(N, 3)`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray|list|tuple
+            each row assumed [X, Y, Z]
+
+        Returns
+        -------
+        List[XYZType]
+        """
+
+        if array is None:
+            return None
+        array = numpy.asarray(array)
+        if array.ndim != 2 or array.shape[1] < 3:
+            raise ValueError('Expected array of shape (N, 3), and received shape {}'.format(array.shape))
+        # tolist converts to native python scalars once, rather than per element
+        rows = array[:, :3].astype(numpy.float64, copy=False).tolist()
+        items = _construct_unchecked(cls, ('X', 'Y', 'Z'), rows)
+        if items is None:
+            items = [cls(X=row[0], Y=row[1], Z=row[2]) for row in rows]
+        return items
 
 
 class LatLonType(Serializable, Arrayable):
     """A two-dimensional geographic point in WGS-84 coordinates."""
+    __slots__ = ()
     _fields = ('Lat', 'Lon')
     _required = _fields
     _numeric_format = {'Lat': '0.16G', 'Lon': '0.16G'}
@@ -130,10 +247,7 @@ class LatLonType(Serializable, Arrayable):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.Lat, self.Lon = Lat, Lon
         super(LatLonType, self).__init__(**kwargs)
 
@@ -154,10 +268,12 @@ class LatLonType(Serializable, Arrayable):
             data array with appropriate entry order
         """
 
-        if order.upper() == 'LAT':
-            return numpy.array([self.Lat, self.Lon], dtype=dtype)
+        out = numpy.empty((2, ), dtype=dtype)
+        if order == 'LAT' or order.upper() == 'LAT':
+            out[0], out[1] = self.Lat, self.Lon
         else:
-            return numpy.array([self.Lon, self.Lat], dtype=dtype)
+            out[0], out[1] = self.Lon, self.Lat
+        return out
 
     @classmethod
     def from_array(cls, array):
@@ -176,11 +292,60 @@ class LatLonType(Serializable, Arrayable):
 
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 2:
-                raise ValueError('Expected array to be of length 2, and received {}'.format(array))
-            return cls(Lat=array[0], Lon=array[1])
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 2)
+        return cls(Lat=values[0], Lon=values[1])
+
+    @classmethod
+    def bulk_to_array(cls, points, dtype=numpy.float64):
+        """
+        Gets an array representation of a collection of instances, in a single
+        allocation.
+
+        Parameters
+        ----------
+        points : list|tuple
+            collection of LatLonType instances
+        dtype : numpy.dtype
+            numpy data type of the return
+
+        Returns
+        -------
+        numpy.ndarray
+            array of shape `(N, 2)`, where each row is of the form [Lat, Lon]
+        """
+
+        getter = attrgetter('Lat', 'Lon')
+        out = numpy.array([getter(entry) for entry in points], dtype=dtype)
+        if out.size == 0:
+            return numpy.empty((0, 2), dtype=dtype)
+        return out
+
+    @classmethod
+    def bulk_from_array(cls, array):
+        """
+        Create a list of instances from an array of shape `(N, 2)`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray|list|tuple
+            each row assumed [Lat, Lon]
+
+        Returns
+        -------
+        List[LatLonType]
+        """
+
+        if array is None:
+            return None
+        array = numpy.asarray(array)
+        if array.ndim != 2 or array.shape[1] < 2:
+            raise ValueError('Expected array of shape (N, 2), and received shape {}'.format(array.shape))
+        # tolist converts to native python scalars once, rather than per element
+        rows = array[:, :2].astype(numpy.float64, copy=False).tolist()
+        items = _construct_unchecked(cls, ('Lat', 'Lon'), rows)
+        if items is None:
+            items = [cls(Lat=row[0], Lon=row[1]) for row in rows]
+        return items
 
     def dms_format(self, frac_secs=False):
         """
@@ -207,13 +372,14 @@ class LatLonType(Serializable, Arrayable):
                 secs = int_func(secs)
             return deg, mins, secs
 
-        X = 'S' if self.Lat < 0 else 'N'
-        Y = 'W' if self.Lon < 0 else 'E'
-        return reduce(self.Lat) + (X, ), reduce(self.Lon) + (Y, )
+        # fetch each value from its descriptor only once
+        lat, lon = self.Lat, self.Lon
+        return reduce(lat) + ('NS'[lat < 0], ), reduce(lon) + ('EW'[lon < 0], )
 
 
 class LatLonArrayElementType(LatLonType):
     """An geographic point in an array"""
+    __slots__ = ()
     _fields = ('Lat', 'Lon', 'index')
     _required = _fields
     _set_as_attribute = ('index', )
@@ -230,10 +396,7 @@ class LatLonArrayElementType(LatLonType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.index = index
         super(LatLonArrayElementType, self).__init__(Lat=Lat, Lon=Lon, **kwargs)
 
@@ -254,15 +417,13 @@ class LatLonArrayElementType(LatLonType):
         """
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 2:
-                raise ValueError('Expected array to be of length 2, and received {}'.format(array))
-            return cls(Lat=array[0], Lon=array[1], index=index)
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 2)
+        return cls(Lat=values[0], Lon=values[1], index=index)
 
 
 class LatLonRestrictionType(LatLonType):
     """A two-dimensional geographic point in WGS-84 coordinates."""
+    __slots__ = ()
     _fields = ('Lat', 'Lon')
     _required = _fields
     # descriptors
@@ -282,10 +443,7 @@ class LatLonRestrictionType(LatLonType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         super(LatLonRestrictionType, self).__init__(Lat=Lat, Lon=Lon, **kwargs)
 
     @classmethod
@@ -304,15 +462,13 @@ class LatLonRestrictionType(LatLonType):
         """
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 2:
-                raise ValueError('Expected array to be of length 2, and received {}'.format(array))
-            return cls(Lat=array[0], Lon=array[1])
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 2)
+        return cls(Lat=values[0], Lon=values[1])
 
 
 class LatLonHAEType(LatLonType):
     """A three-dimensional geographic point in WGS-84 coordinates."""
+    __slots__ = ()
     _fields = ('Lat', 'Lon', 'HAE')
     _required = _fields
     _numeric_format = {'Lat': '0.16G', 'Lon': '0.16G', 'HAE': '0.16G'}
@@ -332,10 +488,7 @@ class LatLonHAEType(LatLonType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.HAE = HAE
         super(LatLonHAEType, self).__init__(Lat=Lat, Lon=Lon, **kwargs)
 
@@ -356,10 +509,13 @@ class LatLonHAEType(LatLonType):
             data array with appropriate entry order
         """
 
-        if order.upper() == 'LAT':
-            return numpy.array([self.Lat, self.Lon, self.HAE], dtype=dtype)
+        out = numpy.empty((3, ), dtype=dtype)
+        if order == 'LAT' or order.upper() == 'LAT':
+            out[0], out[1] = self.Lat, self.Lon
         else:
-            return numpy.array([self.Lon, self.Lat, self.HAE], dtype=dtype)
+            out[0], out[1] = self.Lon, self.Lat
+        out[2] = self.HAE
+        return out
 
     @classmethod
     def from_array(cls, array):
@@ -377,14 +533,64 @@ class LatLonHAEType(LatLonType):
         """
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 3:
-                raise ValueError('Expected array to be of length 3, and received {}'.format(array))
-            return cls(Lat=array[0], Lon=array[1], HAE=array[2])
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 3)
+        return cls(Lat=values[0], Lon=values[1], HAE=values[2])
+
+    @classmethod
+    def bulk_to_array(cls, points, dtype=numpy.float64):
+        """
+        Gets an array representation of a collection of instances, in a single
+        allocation.
+
+        Parameters
+        ----------
+        points : list|tuple
+            collection of LatLonHAEType instances
+        dtype : numpy.dtype
+            numpy data type of the return
+
+        Returns
+        -------
+        numpy.ndarray
+            array of shape `(N, 3)`, where each row is of the form [Lat, Lon, HAE]
+        """
+
+        getter = attrgetter('Lat', 'Lon', 'HAE')
+        out = numpy.array([getter(entry) for entry in points], dtype=dtype)
+        if out.size == 0:
+            return numpy.empty((0, 3), dtype=dtype)
+        return out
+
+    @classmethod
+    def bulk_from_array(cls, array):
+        """
+        Create a list of instances from an array of shape `(N, 3)`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray|list|tuple
+            each row assumed [Lat, Lon, HAE]
+
+        Returns
+        -------
+        List[LatLonHAEType]
+        """
+
+        if array is None:
+            return None
+        array = numpy.asarray(array)
+        if array.ndim != 2 or array.shape[1] < 3:
+            raise ValueError('Expected array of shape (N, 3), and received shape {}'.format(array.shape))
+        # tolist converts to native python scalars once, rather than per element
+        rows = array[:, :3].astype(numpy.float64, copy=False).tolist()
+        items = _construct_unchecked(cls, ('Lat', 'Lon', 'HAE'), rows)
+        if items is None:
+            items = [cls(Lat=row[0], Lon=row[1], HAE=row[2]) for row in rows]
+        return items
 
 
 class LatLonHAERestrictionType(LatLonHAEType):
+    __slots__ = ()
     _fields = ('Lat', 'Lon', 'HAE')
     _required = _fields
     """A three-dimensional geographic point in WGS-84 coordinates."""
@@ -405,10 +611,7 @@ class LatLonHAERestrictionType(LatLonHAEType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         super(LatLonHAERestrictionType, self).__init__(Lat=Lat, Lon=Lon, HAE=HAE, **kwargs)
 
     @classmethod
@@ -427,15 +630,13 @@ class LatLonHAERestrictionType(LatLonHAEType):
         """
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 3:
-                raise ValueError('Expected array to be of length 3, and received {}'.format(array))
-            return cls(Lat=array[0], Lon=array[1], HAE=array[2])
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 3)
+        return cls(Lat=values[0], Lon=values[1], HAE=values[2])
 
 
 class LatLonCornerType(LatLonType):
     """A two-dimensional geographic point in WGS-84 coordinates representing a collection area box corner point."""
+    __slots__ = ()
     _fields = ('Lat', 'Lon', 'index')
     _required = _fields
     _set_as_attribute = ('index', )
@@ -456,10 +657,7 @@ class LatLonCornerType(LatLonType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.index = index
         super(LatLonCornerType, self).__init__(Lat=Lat, Lon=Lon, **kwargs)
 
@@ -489,6 +687,7 @@ class LatLonCornerType(LatLonType):
 
 class LatLonCornerStringType(LatLonType):
     """A two-dimensional geographic point in WGS-84 coordinates representing a collection area box corner point."""
+    __slots__ = ()
     _fields = ('Lat', 'Lon', 'index')
     _required = _fields
     _set_as_attribute = ('index', )
@@ -509,10 +708,7 @@ class LatLonCornerStringType(LatLonType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.index = index
         super(LatLonCornerStringType, self).__init__(Lat=Lat, Lon=Lon, **kwargs)
 
@@ -533,15 +729,13 @@ class LatLonCornerStringType(LatLonType):
         """
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 2:
-                raise ValueError('Expected array to be of length 2, and received {}'.format(array))
-            return cls(Lat=array[0], Lon=array[1], index=index)
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 2)
+        return cls(Lat=values[0], Lon=values[1], index=index)
 
 
 class LatLonHAECornerRestrictionType(LatLonHAERestrictionType):
     """A three-dimensional geographic point in WGS-84 coordinates. Represents a collection area box corner point."""
+    __slots__ = ()
     _fields = ('Lat', 'Lon', 'HAE', 'index')
     _required = _fields
     _set_as_attribute = ('index', )
@@ -564,10 +758,7 @@ class LatLonHAECornerRestrictionType(LatLonHAERestrictionType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.index = index
         super(LatLonHAECornerRestrictionType, self).__init__(Lat=Lat, Lon=Lon, HAE=HAE, **kwargs)
 
@@ -588,15 +779,13 @@ class LatLonHAECornerRestrictionType(LatLonHAERestrictionType):
         """
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 3:
-                raise ValueError('Expected array to be of length 3, and received {}'.format(array))
-            return cls(Lat=array[0], Lon=array[1], HAE=array[2], index=index)
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 3)
+        return cls(Lat=values[0], Lon=values[1], HAE=values[2], index=index)
 
 
 class LatLonHAECornerStringType(LatLonHAEType):
     """A three-dimensional geographic point in WGS-84 coordinates. Represents a collection area box corner point."""
+    __slots__ = ()
     _fields = ('Lat', 'Lon', 'HAE', 'index')
     _required = _fields
     _set_as_attribute = ('index', )
@@ -616,10 +805,7 @@ class LatLonHAECornerStringType(LatLonHAEType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.index = index
         super(LatLonHAECornerStringType, self).__init__(Lat=Lat, Lon=Lon, HAE=HAE, **kwargs)
 
@@ -640,11 +826,8 @@ class LatLonHAECornerStringType(LatLonHAEType):
         """
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 3:
-                raise ValueError('Expected array to be of length 3, and received {}'.format(array))
-            return cls(Lat=array[0], Lon=array[1], HAE=array[2], index=index)
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 3)
+        return cls(Lat=values[0], Lon=values[1], HAE=values[2], index=index)
 
 
 #######
@@ -653,6 +836,7 @@ class LatLonHAECornerStringType(LatLonHAEType):
 
 class RowColType(Serializable, Arrayable):
     """A row and column attribute container - used as indices into array(s)."""
+    __slots__ = ()
     _fields = ('Row', 'Col')
     _required = _fields
     Row = _IntegerDescriptor(
@@ -669,10 +853,7 @@ class RowColType(Serializable, Arrayable):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.Row, self.Col = Row, Col
         super(RowColType, self).__init__(**kwargs)
 
@@ -691,7 +872,9 @@ class RowColType(Serializable, Arrayable):
             array of the form [Row, Col]
         """
 
-        return numpy.array([self.Row, self.Col], dtype=dtype)
+        out = numpy.empty((2, ), dtype=dtype)
+        out[0], out[1] = self.Row, self.Col
+        return out
 
     @classmethod
     def from_array(cls, array):
@@ -709,15 +892,65 @@ class RowColType(Serializable, Arrayable):
         """
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 2:
-                raise ValueError('Expected array to be of length 2, and received {}'.format(array))
-            return cls(Row=array[0], Col=array[1])
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 2)
+        return cls(Row=values[0], Col=values[1])
+
+    @classmethod
+    def bulk_to_array(cls, points, dtype=numpy.int64):
+        """
+        Gets an array representation of a collection of instances, in a single
+        allocation.
+
+        Parameters
+        ----------
+        points : list|tuple
+            collection of RowColType instances
+        dtype : numpy.dtype
+            numpy data type of the return
+
+        Returns
+        -------
+        numpy.ndarray
+            array of shape `(N, 2)`, where each row is of the form [Row, Col]
+        """
+
+        getter = attrgetter('Row', 'Col')
+        out = numpy.array([getter(entry) for entry in points], dtype=dtype)
+        if out.size == 0:
+            return numpy.empty((0, 2), dtype=dtype)
+        return out
+
+    @classmethod
+    def bulk_from_array(cls, array):
+        """
+        Create a list of instances from an array of shape `(N, 2)`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray|list|tuple
+            each row assumed [Row, Col]
+
+        Returns
+        -------
+        List[RowColType]
+        """
+
+        if array is None:
+            return None
+        array = numpy.asarray(array)
+        if array.ndim != 2 or array.shape[1] < 2:
+            raise ValueError('Expected array of shape (N, 2), and received shape {}'.format(array.shape))
+        # tolist converts to native python scalars once, rather than per element
+        rows = array[:, :2].astype(numpy.int64, copy=False).tolist()
+        items = _construct_unchecked(cls, ('Row', 'Col'), rows)
+        if items is None:
+            items = [cls(Row=row[0], Col=row[1]) for row in rows]
+        return items
 
 
 class RowColArrayElement(RowColType):
     """A array element row and column attribute container - used as indices into other array(s)."""
+    __slots__ = ()
     # Note - in the SICD standard this type is listed as RowColvertexType. This is not a descriptive name
     # and has an inconsistency in camel case
     _fields = ('Row', 'Col', 'index')
@@ -737,10 +970,7 @@ class RowColArrayElement(RowColType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.index = index
         super(RowColArrayElement, self).__init__(Row=Row, Col=Col, **kwargs)
 
@@ -762,23 +992,175 @@ class RowColArrayElement(RowColType):
         """
         if array is None:
             return None
-        if isinstance(array, (numpy.ndarray, list, tuple)):
-            if len(array) < 2:
-                raise ValueError('Expected array to be of length 2, and received {}'.format(array))
-            return cls(Row=array[0], Col=array[1], index=index)
-        raise ValueError('Expected array to be numpy.ndarray, list, or tuple, got {}'.format(type(array)))
+        values = _coerce_array(array, 2)
+        return cls(Row=values[0], Col=values[1], index=index)
 
 
 ###############
 # Polynomial Types
 
 
+def _horner(coefs, x):
+    """
+    Evaluate the one-dimensional polynomial with float64 coefficient array `coefs`
+    at the point(s) `x` using Horner's method. This agrees with :func:`polyval`
+    of `numpy.polynomial.polynomial`, but skips its argument coercion, which
+    dominates the cost for the low order polynomials used in SICD.
+
+    Parameters
+    ----------
+    coefs : numpy.ndarray
+        non-empty one-dimensional array of dtype float64
+    x : float|int|numpy.ndarray|list|tuple
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    if isinstance(x, (list, tuple)):
+        x = numpy.asarray(x)
+    # iterate over native floats, which is far cheaper than numpy scalars
+    values = coefs.tolist()
+    if isinstance(x, numpy.ndarray) and x.ndim > 0:
+        # accumulate in place, so only the one output array is ever allocated - NB: this is
+        #   at least float64, as for polyval, regardless of the (possibly lower) precision of x
+        out = numpy.full(x.shape, values[-1], dtype=numpy.result_type(x, numpy.float64))
+        for coef in values[-2::-1]:
+            out *= x
+            out += coef
+        return out
+
+    if isinstance(x, (numpy.ndarray, numpy.generic)):
+        # reduce to a native scalar, so the arithmetic below is in double precision
+        x = x.item()
+    out = values[-1]
+    for coef in values[-2::-1]:
+        out = coef + out*x
+    if isinstance(out, complex):
+        return numpy.complex128(out)
+    return numpy.float64(out)
+
+
+def _horner2d_stacked(coefs, x, y):
+    """
+    Evaluate the stack of two-dimensional polynomials with float64 coefficient array `coefs`
+    at the array of points [`x`, `y`], using Horner's method over exponent2 for each row of
+    coefficients, and then over exponent1. Every polynomial in the stack is updated by each
+    array operation, so the points are traversed once rather than once per polynomial.
+
+    Parameters
+    ----------
+    coefs : numpy.ndarray
+        array of shape `(K, n1, n2)` and dtype float64
+    x : numpy.ndarray
+    y : numpy.ndarray
+        of the same shape as `x`
+
+    Returns
+    -------
+    numpy.ndarray
+        of shape `(K, ) + x.shape`
+    """
+
+    siz1, siz2 = coefs.shape[1:]
+    # broadcast each coefficient (column) over the points
+    coefs = coefs.reshape(coefs.shape + (1, )*x.ndim)
+    out = numpy.empty((coefs.shape[0], ) + x.shape, dtype=numpy.float64)
+    row = numpy.empty_like(out)
+    for i in range(siz1-1, -1, -1):
+        acc = out if i == siz1-1 else row
+        acc[:] = coefs[:, i, -1]
+        for j in range(siz2-2, -1, -1):
+            acc *= y
+            acc += coefs[:, i, j]
+        if acc is row:
+            out *= x
+            out += row
+    return out
+
+
+_BINOMIAL_MATRICES = {}
+
+
+def _get_binomial_matrix(size):
+    """
+    Gets the upper triangular matrix of binomial coefficients `C(j, k)`, indexed as
+    `[k, j]`, and the matching matrix of exponents `max(j-k, 0)`. These are cached by size.
+
+    Parameters
+    ----------
+    size : int
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+    """
+
+    if size not in _BINOMIAL_MATRICES:
+        binomials = numpy.zeros((size, size), dtype=numpy.float64)
+        row = [1, ]  # the (integer) row of Pascal's triangle for j
+        for j in range(size):
+            binomials[:j+1, j] = row
+            row = [1, ] + [row[i] + row[i+1] for i in range(j)] + [1, ]
+        powers = numpy.arange(size)
+        exponents = numpy.maximum(powers[numpy.newaxis, :] - powers[:, numpy.newaxis], 0)
+        _BINOMIAL_MATRICES[size] = (binomials, exponents)
+    return _BINOMIAL_MATRICES[size]
+
+
+def _geometric(value, size):
+    """
+    Gets the powers `[1, value, value^2, ..., value^(size-1)]` by cumulative product,
+    which avoids the exponential and logarithm evaluations of :func:`numpy.power`.
+
+    Parameters
+    ----------
+    value : float
+    size : int
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    out = numpy.empty((size, ), dtype=numpy.float64)
+    out[0] = 1
+    out[1:] = value
+    return numpy.cumprod(out, out=out)
+
+
+def _get_shift_matrix(size, t_0, alpha):
+    r"""
+    Gets the matrix `M` which transforms the coefficients `c` of a polynomial `P` of the given
+    coefficient size into the coefficients `M.dot(c)` of the polynomial :math:`x\mapsto P(\alpha\cdot x - t_0)`.
+    That is, `M[k, j] = alpha^k*C(j, k)*(-t_0)^(j-k)` for `j >= k`, and `0` otherwise.
+
+    Parameters
+    ----------
+    size : int
+    t_0 : float
+    alpha : float
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    binomials, exponents = _get_binomial_matrix(size)
+    # NB: the zero entries of binomials clear the lower triangle, where the exponent is also 0
+    out = binomials*_geometric(-float(t_0), size)[exponents]
+    if alpha != 1:
+        out *= _geometric(float(alpha), size)[:, numpy.newaxis]
+    return out
+
+
 class Poly1DType(Serializable, Arrayable):
     """
     Represents a one-variable polynomial, defined by one-dimensional coefficient array.
     """
 
-    __slots__ = ('_coefs', )
+    __slots__ = ('_coefs', '_order1', '_derivatives')
     _fields = ('Coefs', 'order1')
     _required = ('Coefs', )
     _numeric_format = {'Coefs': '0.16G'}
@@ -792,11 +1174,9 @@ class Poly1DType(Serializable, Arrayable):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self._coefs = None
+        self._derivatives = {}
         self.Coefs = Coefs
         super(Poly1DType, self).__init__(**kwargs)
 
@@ -806,7 +1186,7 @@ class Poly1DType(Serializable, Arrayable):
         int: The order1 attribute [READ ONLY]  - that is, largest exponent presented in the monomial terms of coefs.
         """
 
-        return self.Coefs.size - 1
+        return self._order1
 
     @property
     def Coefs(self):
@@ -826,7 +1206,7 @@ class Poly1DType(Serializable, Arrayable):
             raise ValueError('The coefficient array for a Poly1DType instance must be defined.')
 
         if isinstance(value, (list, tuple)):
-            value = numpy.array(value, dtype=numpy.float64)
+            value = numpy.asarray(value, dtype=numpy.float64)
 
         if not isinstance(value, numpy.ndarray):
             raise ValueError(
@@ -835,13 +1215,15 @@ class Poly1DType(Serializable, Arrayable):
             raise ValueError(
                 'Coefs for class Poly1D must be one-dimensional. Received numpy.ndarray '
                 'of shape {}.'.format(value.shape))
-        elif not value.dtype.name == 'float64':
-            value = numpy.cast[numpy.float64](value)
+        elif value.dtype != numpy.float64:
+            value = value.astype(numpy.float64, copy=False)
         self._coefs = value
+        self._order1 = value.size - 1
+        self._derivatives = {}
 
     def __call__(self, x):
         """
-        Evaluate the polynomial at points `x`. This passes `x` straight through to :func:`polyval` of
+        Evaluate the polynomial at points `x`, in agreement with :func:`polyval` of
         `numpy.polynomial.polynomial`.
 
         Parameters
@@ -854,7 +1236,41 @@ class Poly1DType(Serializable, Arrayable):
         numpy.ndarray
         """
 
-        return numpy.polynomial.polynomial.polyval(x, self._coefs)
+        return _horner(self._coefs, x)
+
+    def evaluate_many(self, x, out=None):
+        """
+        Evaluate the polynomial at the array of points `x`. Callers with many points should
+        collect them into a single array and use this (or `__call__`), rather than
+        evaluating point by point.
+
+        Parameters
+        ----------
+        x : numpy.ndarray|list|tuple
+            The points at which to evaluate, which will be converted to a contiguous float64 array.
+        out : None|numpy.ndarray
+            Optional buffer of the same shape as `x` to hold the result, to avoid allocation
+            across repeated calls.
+
+        Returns
+        -------
+        numpy.ndarray
+            `out`, if provided, otherwise a new float64 array of the same shape as `x`.
+        """
+
+        x = numpy.ascontiguousarray(x, dtype=numpy.float64)
+        if out is None:
+            out = numpy.empty_like(x)
+        elif out.shape != x.shape:
+            raise ValueError(
+                'The output buffer must have shape {}, but has shape {}'.format(x.shape, out.shape))
+
+        values = self._coefs.tolist()
+        out.fill(values[-1])
+        for coef in values[-2::-1]:
+            out *= x
+            out += coef
+        return out
 
     def __getitem__(self, item):
         return self._coefs[item]
@@ -875,11 +1291,33 @@ class Poly1DType(Serializable, Arrayable):
         Poly1DType|numpy.ndarray
         """
 
-        coefs = numpy.polynomial.polynomial.polyder(self._coefs, der_order)
+        coefs = self._get_derivative_coefs(der_order).copy()
         if return_poly:
             return Poly1DType(Coefs=coefs)
         return coefs
 
+    def _get_derivative_coefs(self, der_order):
+        """
+        Gets the (shared, so do not modify) `der_order` derivative coefficient array.
+        This is cached per order, and recalculated if the coefficients have been
+        modified in place since.
+
+        Parameters
+        ----------
+        der_order : int
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        key = self._coefs.tobytes()
+        entry = self._derivatives.get(der_order, None)
+        if entry is None or entry[0] != key:
+            entry = (key, numpy.polynomial.polynomial.polyder(self._coefs, der_order))
+            self._derivatives[der_order] = entry
+        return entry[1]
+
     def derivative_eval(self, x, der_order=1):
         """
         Evaluate the `der_order` derivative of the polynomial at points `x`. This uses the
@@ -896,10 +1334,9 @@ class Poly1DType(Serializable, Arrayable):
         numpy.ndarray
         """
 
-        coefs = self.derivative(der_order=der_order, return_poly=False)
-        return numpy.polynomial.polynomial.polyval(x, coefs)
+        return _horner(self._get_derivative_coefs(der_order), x)
 
-    def shift(self, t_0, alpha=1, return_poly=False):
+    def shift(self, t_0, alpha=1, return_poly=False, out=None, copy=True):
         r"""
         Transform a polynomial with respect to a affine shift in the coordinate system.
         That is, :math:`P(x) = Q(\alpha\cdot(t-t_0))`.
@@ -921,22 +1358,35 @@ class Poly1DType(Serializable, Arrayable):
         return_poly : bool
             if `True`, a Poly1DType object be returned, otherwise the coefficients array is returned.
 
+        out : None|numpy.ndarray
+            Optional float64 buffer, of the same shape as the coefficient array, to hold the shifted
+            coefficients. This allows callers to reuse a single buffer across many shifts. Note that
+            a returned Poly1DType will use this buffer as its coefficient array.
+
+        copy : bool
+            If `False`, `out` is not provided, and the transform is the identity, then the result
+            shares the coefficient array of this polynomial, rather than a copy. Only use this
+            if the result will not be modified.
+
         Returns
         -------
         Poly1DType|numpy.ndarray
         """
-        # prepare array workspace
-        out = numpy.copy(self._coefs)
-        if t_0 != 0 and out.size > 1:
-            siz = out.size
-            # let's use horner's method, so iterate from top down
-            for i in range(siz):
-                index = siz-i-1
-                if i > 0:
-                    out[index:siz-1] -= t_0*out[index+1:siz]
+        siz = self._coefs.size
+        is_identity = (siz == 1 or (t_0 == 0 and alpha == 1))
+        if is_identity and out is None and not copy:
+            out = self._coefs
+        elif out is None:
+            out = numpy.empty_like(self._coefs)
+        elif out.shape != self._coefs.shape or out.dtype != numpy.float64:
+            raise ValueError(
+                'The output buffer must be a float64 array of shape {}, but is a {} array '
+                'of shape {}'.format(self._coefs.shape, out.dtype, out.shape))
 
-        if alpha != 1 and out.size > 1:
-            out *= numpy.power(alpha, numpy.arange(out.size))
+        if not is_identity:
+            out[:] = _get_shift_matrix(siz, t_0, alpha).dot(self._coefs)
+        elif out is not self._coefs:
+            numpy.copyto(out, self._coefs)
 
         if return_poly:
             return Poly1DType(Coefs=out)
@@ -985,10 +1435,9 @@ class Poly1DType(Serializable, Arrayable):
 
         coef_key = cls._child_xml_ns_key.get('Coefs', ns_key)
         coef_nodes = _find_children(node, 'Coef', xml_ns, coef_key)
-        for cnode in coef_nodes:
-            ind = int_func(cnode.attrib['exponent1'])
-            val = float(_get_node_value(cnode))
-            coefs[ind] = val
+        # gather everything, and then assign with a single indexed store
+        exponents = [int_func(cnode.attrib['exponent1']) for cnode in coef_nodes]
+        coefs[exponents] = [float(_get_node_value(cnode)) for cnode in coef_nodes]
         return cls(Coefs=coefs)
 
     def to_node(self, doc, tag, ns_key=None, parent=None, check_validity=False, strict=DEFAULT_STRICT, exclude=()):
@@ -1009,14 +1458,16 @@ class Poly1DType(Serializable, Arrayable):
 
         node.attrib['order1'] = str(self.order1)
         fmt_func = self._get_formatter('Coef')
-        for i, val in enumerate(self.Coefs):
+        # NB: create the children directly, with their attributes, rather than
+        #   through the general helpers which require a further attribute access each
+        sub_element = ElementTree.SubElement
+        for i, val in enumerate(self._coefs.tolist()):
             # if val != 0.0:  # should we serialize it sparsely?
-            cnode = _create_text_node(doc, ctag, fmt_func(val), parent=node)
-            cnode.attrib['exponent1'] = str(i)
+            sub_element(node, ctag, {'exponent1': str(i)}).text = fmt_func(val)
         return node
 
     def to_dict(self, check_validity=False, strict=DEFAULT_STRICT, exclude=()):
-        out = OrderedDict()
+        out = ordered_dict()
         out['Coefs'] = self.Coefs.tolist()
         return out
 
@@ -1039,18 +1490,16 @@ class Poly2DType(Serializable, Arrayable):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self._coefs = None
         self.Coefs = Coefs
         super(Poly2DType, self).__init__(**kwargs)
 
     def __call__(self, x, y):
         """
-        Evaluate a polynomial at points [`x`, `y`]. This passes `x`,`y` straight through to :func:`polyval2d` of
-        `numpy.polynomial.polynomial`.
+        Evaluate a polynomial at points [`x`, `y`]. This agrees with :func:`polyval2d` of
+        `numpy.polynomial.polynomial`, but uses a fused Horner evaluation - over exponent2 for each
+        row of coefficients, then over exponent1.
 
         Parameters
         ----------
@@ -1064,7 +1513,60 @@ class Poly2DType(Serializable, Arrayable):
         numpy.ndarray
         """
 
-        return numpy.polynomial.polynomial.polyval2d(x, y, self._coefs)
+        if isinstance(x, (list, tuple)):
+            x = numpy.asarray(x)
+        if isinstance(y, (list, tuple)):
+            y = numpy.asarray(y)
+        if numpy.shape(x) != numpy.shape(y):
+            raise ValueError('x and y must have the same shape, got {} and {}'.format(numpy.shape(x), numpy.shape(y)))
+
+        rows = self._coefs
+        out = _horner(rows[-1], y)
+        if isinstance(out, numpy.ndarray):
+            # NB: the accumulator must also hold the type of x (e.g. complex), and
+            #   be at least float64, to be updated in place
+            out = out.astype(numpy.result_type(x, out), copy=False)
+            for row in rows[-2::-1]:
+                out *= x
+                out += _horner(row, y)
+            return out
+
+        for row in rows[-2::-1]:
+            out = out*x + _horner(row, y)
+        return out
+
+    def evaluate_on_grid(self, x, y):
+        """
+        Evaluate the polynomial on the Cartesian product of the points `x` and `y`. This agrees
+        with :func:`polygrid2d` of `numpy.polynomial.polynomial`, but is considerably faster
+        for large grids, since the powers of `x` are only formed once (as a Vandermonde matrix),
+        and the remaining evaluation over `y` is done in place.
+
+        Parameters
+        ----------
+        x : numpy.ndarray|list|tuple
+            The first dependent variable of the grid.
+        y : numpy.ndarray|list|tuple
+            The second dependent variable of the grid.
+
+        Returns
+        -------
+        numpy.ndarray
+            Of shape `x.shape + y.shape`.
+        """
+
+        x = numpy.asarray(x, dtype=numpy.float64)
+        y = numpy.asarray(y, dtype=numpy.float64)
+        # the polynomial in y for each x, with coefficients along the final axis
+        y_coefs = numpy.polynomial.polynomial.polyvander(x.ravel(), self.order1).dot(self._coefs)
+
+        out = numpy.empty((x.size, y.size), dtype=numpy.float64)
+        out[:] = y_coefs[:, -1:]
+        flat_y = y.ravel()
+        for j in range(self.order2-1, -1, -1):
+            out *= flat_y
+            out += y_coefs[:, j:j+1]
+        return numpy.reshape(out, x.shape + y.shape)
 
     @property
     def order1(self):
@@ -1100,7 +1602,7 @@ class Poly2DType(Serializable, Arrayable):
             raise ValueError('The coefficient array for a Poly2DType instance must be defined.')
 
         if isinstance(value, (list, tuple)):
-            value = numpy.array(value, dtype=numpy.float64)
+            value = numpy.asarray(value, dtype=numpy.float64)
 
         if not isinstance(value, numpy.ndarray):
             raise ValueError(
@@ -1109,14 +1611,14 @@ class Poly2DType(Serializable, Arrayable):
             raise ValueError(
                 'Coefs for class Poly2D must be two-dimensional. Received numpy.ndarray '
                 'of shape {}.'.format(value.shape))
-        elif not value.dtype.name == 'float64':
-            value = numpy.cast[numpy.float64](value)
+        elif value.dtype != numpy.float64:
+            value = value.astype(numpy.float64, copy=False)
         self._coefs = value
 
     def __getitem__(self, item):
         return self._coefs[item]
 
-    def shift(self, t1_shift=0, t1_scale=1, t2_shift=0, t2_scale=1, return_poly=False):
+    def shift(self, t1_shift=0, t1_scale=1, t2_shift=0, t2_scale=1, return_poly=False, copy=True):
         r"""
         Transform a polynomial with respect to a affine shift in the coordinate system.
         That is, :math:`P(x1, x2) = Q(t1_scale\cdot(t1 - t1_shift), t2_scale\cdot(t2 - t2_shift))`.
@@ -1141,35 +1643,23 @@ class Poly2DType(Serializable, Arrayable):
             **NOTE:** it is assumed that the coordinate system is re-centered, and **then** scaled.
         return_poly : bool
             if `True`, a Poly2DType object be returned, otherwise the coefficients array is returned.
+        copy : bool
+            If `False` and the transform is the identity, then the result shares the coefficient
+            array of this polynomial, rather than a copy. Only use this if the result will not be modified.
 
         Returns
         -------
         Poly2DType|numpy.ndarray
         """
-        # prepare our array workspace
-        out = numpy.copy(self._coefs)
-
-        # handle first axis - everything is commutative, so order doesn't matter
-        if t1_shift != 0 and self._coefs.shape[0] > 1:
-            siz = out.shape[0]
-            # let's use horner's method, so iterate from top down
-            for i in range(siz):
-                index = siz-i-1
-                if i > 0:
-                    out[index:siz-1, :] -= t1_shift*out[index+1:siz, :]
-        if t1_scale != 1 and out.shape[0] > 1:
-            out = numpy.power(t1_scale, numpy.arange(out.shape[0]))[:, numpy.newaxis]*out
-
-        # handle second axis
-        if t2_shift != 0 and out.shape[1] > 1:
-            siz = out.shape[1]
-            # let's use horner's method, so iterate from top down
-            for i in range(siz):
-                index = siz-i-1
-                if i > 0:
-                    out[:, index:siz-1] -= t1_shift*out[:, index+1:siz]
-        if t2_scale != 1 and out.shape[1] > 1:
-            out *= numpy.power(t2_scale, numpy.arange(out.shape[1]))
+        out = self._coefs
+        # apply the transform along each axis - everything is commutative, so order doesn't matter
+        siz1, siz2 = out.shape
+        if siz1 > 1 and (t1_shift != 0 or t1_scale != 1):
+            out = _get_shift_matrix(siz1, t1_shift, t1_scale).dot(out)
+        if siz2 > 1 and (t2_shift != 0 or t2_scale != 1):
+            out = out.dot(_get_shift_matrix(siz2, t2_shift, t2_scale).T)
+        if copy and out is self._coefs:
+            out = numpy.copy(out)
 
         if return_poly:
             return Poly2DType(Coefs=out)
@@ -1219,11 +1709,10 @@ class Poly2DType(Serializable, Arrayable):
 
         coef_key = cls._child_xml_ns_key.get('Coefs', ns_key)
         coef_nodes = _find_children(node, 'Coef', xml_ns, coef_key)
-        for cnode in coef_nodes:
-            ind1 = int_func(cnode.attrib['exponent1'])
-            ind2 = int_func(cnode.attrib['exponent2'])
-            val = float(_get_node_value(cnode))
-            coefs[ind1, ind2] = val
+        # gather everything, and then assign with a single indexed store
+        exponents1 = [int_func(cnode.attrib['exponent1']) for cnode in coef_nodes]
+        exponents2 = [int_func(cnode.attrib['exponent2']) for cnode in coef_nodes]
+        coefs[exponents1, exponents2] = [float(_get_node_value(cnode)) for cnode in coef_nodes]
         return cls(Coefs=coefs)
 
     def to_node(self, doc, tag, ns_key=None, parent=None, check_validity=False, strict=DEFAULT_STRICT, exclude=()):
@@ -1245,16 +1734,19 @@ class Poly2DType(Serializable, Arrayable):
         node.attrib['order1'] = str(self.order1)
         node.attrib['order2'] = str(self.order2)
         fmt_func = self._get_formatter('Coefs')
-        for i, val1 in enumerate(self._coefs):
+        # NB: create the children directly, with their attributes, rather than
+        #   through the general helpers which require a further attribute access each
+        sub_element = ElementTree.SubElement
+        exponent2 = [str(j) for j in range(self._coefs.shape[1])]
+        for i, val1 in enumerate(self._coefs.tolist()):
+            exponent1 = str(i)
             for j, val in enumerate(val1):
                 # if val != 0.0:  # should we serialize it sparsely?
-                cnode = _create_text_node(doc, ctag, fmt_func(val), parent=node)
-                cnode.attrib['exponent1'] = str(i)
-                cnode.attrib['exponent2'] = str(j)
+                sub_element(node, ctag, {'exponent1': exponent1, 'exponent2': exponent2[j]}).text = fmt_func(val)
         return node
 
     def to_dict(self,  check_validity=False, strict=DEFAULT_STRICT, exclude=()):
-        out = OrderedDict()
+        out = ordered_dict()
         out['Coefs'] = self.Coefs.tolist()
         return out
 
@@ -1288,18 +1780,13 @@ class XYZPolyType(Serializable, Arrayable):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.X, self.Y, self.Z = X, Y, Z
         super(XYZPolyType, self).__init__(**kwargs)
 
     def __call__(self, t):
         """
-        Evaluate the polynomial at points `t`. This passes `t` straight through
-        to :func:`polyval` of `numpy.polynomial.polynomial` for each of
-        `X,Y,Z` components. If any of `X,Y,Z` is not populated, then None is returned.
+        Evaluate the polynomial at points `t`, for each of the `X,Y,Z` components.
 
         Parameters
         ----------
@@ -1309,15 +1796,46 @@ class XYZPolyType(Serializable, Arrayable):
         Returns
         -------
         numpy.ndarray
+            Of shape `(3, )` for scalar `t`, and otherwise of shape `t.shape + (3, )`.
         """
 
-        X = self.X(t)
-        Y = self.Y(t)
-        Z = self.Z(t)
-        if numpy.ndim(X) == 0:
-            return numpy.array([X, Y, Z])
-        else:
-            return numpy.stack((X, Y, Z), axis=-1)
+        if numpy.ndim(t) == 0:
+            return numpy.array([self.X(t), self.Y(t), self.Z(t)])
+
+        # the (non-contiguous) view with the components along the final axis
+        return numpy.moveaxis(self.evaluate_stacked(t), 0, -1)
+
+    def evaluate_stacked(self, t, out=None):
+        """
+        Evaluate the polynomial at the array of points `t`, with the `X,Y,Z` components
+        stacked along the first axis. Each component is evaluated directly into one
+        contiguous block of memory, which is far cheaper than interleaving the components.
+
+        Parameters
+        ----------
+        t : numpy.ndarray|list|tuple
+            The points at which to evaluate, which will be converted to a float64 array.
+        out : None|numpy.ndarray
+            Optional float64 buffer of shape `(3, ) + t.shape` to hold the result, to avoid
+            allocation across repeated calls.
+
+        Returns
+        -------
+        numpy.ndarray
+            `out`, if provided, otherwise a new float64 array of shape `(3, ) + t.shape`.
+        """
+
+        t = numpy.ascontiguousarray(t, dtype=numpy.float64)
+        if out is None:
+            out = numpy.empty((3, ) + t.shape, dtype=numpy.float64)
+        elif out.shape != (3, ) + t.shape:
+            raise ValueError(
+                'The output buffer must have shape {}, but has shape {}'.format((3, ) + t.shape, out.shape))
+
+        self.X.evaluate_many(t, out=out[0])
+        self.Y.evaluate_many(t, out=out[1])
+        self.Z.evaluate_many(t, out=out[2])
+        return out
 
     def get_array(self, dtype=numpy.object):
         """Gets an array representation of the class instance.
@@ -1336,7 +1854,11 @@ class XYZPolyType(Serializable, Arrayable):
         """
 
         if dtype in ['object', numpy.object]:
-            return numpy.array([self.X, self.Y, self.Z], dtype=numpy.object)
+            # NB: assigning into an empty array avoids numpy probing each
+            #   Poly1DType element as a potential nested sequence
+            out = numpy.empty((3, ), dtype=numpy.object)
+            out[0], out[1], out[2] = self.X, self.Y, self.Z
+            return out
         else:
             # return a 3 x N array of coefficients
             xv = self.X.Coefs
@@ -1440,8 +1962,16 @@ class XYZPolyType(Serializable, Arrayable):
         XYZPolyType|list
         """
 
-        coefs = [
-            getattr(self, attrib).shift(t_0, alpha=alpha, return_poly=False) for attrib in ['X', 'Y', 'Z']]
+        polys = (self.X, self.Y, self.Z)
+        siz = polys[0].Coefs.size
+        if all(poly.Coefs.size == siz for poly in polys):
+            # transform the stacked coefficients with a single shared matrix, and hand back
+            #   the (contiguous) rows of the result
+            stacked = numpy.vstack([poly.Coefs for poly in polys])
+            stacked = stacked.dot(_get_shift_matrix(siz, t_0, alpha).T)
+            coefs = [stacked[0], stacked[1], stacked[2]]
+        else:
+            coefs = [poly.shift(t_0, alpha=alpha, return_poly=False) for poly in polys]
 
         if return_poly:
             return XYZPolyType(X=coefs[0], Y=coefs[1], Z=coefs[2])
@@ -1471,10 +2001,7 @@ class XYZPolyAttributeType(XYZPolyType):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.index = index
         super(XYZPolyAttributeType, self).__init__(X=X, Y=Y, Z=Z, **kwargs)
 
@@ -1529,10 +2056,7 @@ class GainPhasePolyType(Serializable):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.GainPoly = GainPoly
         self.PhasePoly = PhasePoly
         super(GainPhasePolyType, self).__init__(**kwargs)
@@ -1555,9 +2079,17 @@ class GainPhasePolyType(Serializable):
         """
 
         # TODO: is it remotely sensible that only one of these is defined?
-        if self.GainPoly is None or self.PhasePoly is None:
+        gain_poly, phase_poly = self.GainPoly, self.PhasePoly
+        if gain_poly is None or phase_poly is None:
             return None
-        return numpy.array([self.GainPoly(x, y), self.PhasePoly(x, y)], dtype=numpy.float64)
+
+        gain_coefs, phase_coefs = gain_poly.Coefs, phase_poly.Coefs
+        if numpy.ndim(x) > 0 and numpy.shape(x) == numpy.shape(y) and gain_coefs.shape == phase_coefs.shape:
+            # evaluate both in a single traversal of the points
+            return _horner2d_stacked(
+                numpy.stack((gain_coefs, phase_coefs)),
+                numpy.asarray(x, dtype=numpy.float64), numpy.asarray(y, dtype=numpy.float64))
+        return numpy.array([gain_poly(x, y), phase_poly(x, y)], dtype=numpy.float64)
 
 
 #############
@@ -1594,10 +2126,7 @@ class ErrorDecorrFuncType(Serializable):
         kwargs : dict
         """
 
-        if '_xml_ns' in kwargs:
-            self._xml_ns = kwargs['_xml_ns']
-        if '_xml_ns_key' in kwargs:
-            self._xml_ns_key = kwargs['_xml_ns_key']
+        _set_xml_ns(self, kwargs)
         self.CorrCoefZero = CorrCoefZero
         self.DecorrRate = DecorrRate
         super(ErrorDecorrFuncType, self).__init__(**kwargs)
@@ -4,6 +4,7 @@ Common functionality for converting metadata
 """
 import sys
 import logging
+from io import BytesIO
 from xml.etree import ElementTree
 
 import numpy
@@ -24,36 +25,41 @@ __classification__ = "UNCLASSIFIED"
 __author__ = "Thomas McCullough"
 
 
+# the datetime64 type and the seconds per unit for each supported precision
+_PRECISION_TABLE = {
+    's': ('datetime64[s]', 1.),
+    'ms': ('datetime64[ms]', 1e-3),
+    'us': ('datetime64[us]', 1e-6),
+    'ns': ('datetime64[ns]', 1e-9)}
+
+
 def get_seconds(dt1, dt2, precision='us'):
     """
-    The number of seconds between two numpy.datetime64 elements.
+    The number of seconds between two numpy.datetime64 elements, or broadcast
+    compatible arrays of such.
 
     Parameters
     ----------
-    dt1 : numpy.datetime64
-    dt2 : numpy.datetime64
+    dt1 : numpy.datetime64|numpy.ndarray
+    dt2 : numpy.datetime64|numpy.ndarray
     precision : str
         one of 's', 'ms', 'us', or 'ns'
     Returns
     -------
-    float
+    float|numpy.ndarray
         the number of seconds between dt2 and dt1 (i.e. dt1 - dt2).
     """
-    if precision == 's':
-        scale = 1
-    elif precision == 'ms':
-        scale = 1e-3
-    elif precision == 'us':
-        scale = 1e-6
-    elif precision == 'ns':
-        scale = 1e-9
-    else:
+    try:
+        dtype, scale = _PRECISION_TABLE[precision]
+    except KeyError:
         raise ValueError('unrecognized precision {}'.format(precision))
 
-    dtype = 'datetime64[{}]'.format(precision)
-    tdt1 = dt1.astype(dtype)
-    tdt2 = dt2.astype(dtype)
-    return float((tdt1.astype('int64') - tdt2.astype('int64'))*scale)
+    # NB: the difference is a timedelta64 in units of the given precision
+    diff = dt1.astype(dtype) - dt2.astype(dtype)
+    if isinstance(diff, numpy.ndarray):
+        # reinterpret the timedelta64 array as its int64 counts, without a copy
+        return diff.view('int64')*scale
+    return float(diff.astype('int64')*scale)
 
 
 def two_dim_poly_fit(x, y, z, x_order=2, y_order=2, x_scale=1, y_scale=1, rcond=None):
@@ -74,10 +80,13 @@ def two_dim_poly_fit(x, y, z, x_order=2, y_order=2, x_scale=1, y_scale=1, rcond=
         the order for y
     x_scale : float
         In order to help the fitting problem to become better conditioned, the independent
-        variables can be scaled, the fit performed, and then the solution rescaled.
+        variables can be scaled, the fit performed, and then the solution rescaled. Note that
+        the columns of the design matrix are also normalized before the fit, so this is
+        generally unnecessary.
     y_scale : float
     rcond : None|float
-        passed through to :func:`numpy.linalg.lstsq`.
+        passed through to :func:`numpy.linalg.lstsq`. The singular values are those of the
+        column normalized design matrix.
     Returns
     -------
     numpy.ndarray
@@ -89,17 +98,25 @@ def two_dim_poly_fit(x, y, z, x_order=2, y_order=2, x_scale=1, y_scale=1, rcond=
     if (x.size != z.size) or (y.size != z.size):
         raise ValueError('x, y, z must have the same cardinality size.')
 
-    x = x.flatten()*x_scale
-    y = y.flatten()*y_scale
+    x = x.astype(numpy.float64).flatten()*x_scale
+    y = y.astype(numpy.float64).flatten()*y_scale
     z = z.flatten()
     # first, we need to formulate this as A*t = z
     # where A has shape (x.size, (x_order+1)*(y_order+1))
     # and t has shape ((x_order+1)*(y_order+1), )
-    A = numpy.empty((x.size, (x_order+1)*(y_order+1)), dtype=numpy.float64)
-    for i, index in enumerate(numpy.ndindex((x_order+1, y_order+1))):
-        A[:, i] = numpy.power(x, index[0])*numpy.power(y, index[1])
+    # NB: the columns of A are x^i*y^j, in the order of numpy.ndindex((x_order+1, y_order+1)),
+    #   formed from the outer product of the two Vandermonde matrices (of successive powers)
+    x_vander = numpy.vander(x, x_order+1, increasing=True)
+    y_vander = numpy.vander(y, y_order+1, increasing=True)
+    A = (x_vander[:, :, numpy.newaxis]*y_vander[:, numpy.newaxis, :]).reshape((x.size, -1))
+    # precondition by scaling each column to unit norm, which substantially reduces
+    #   the condition number when the powers have very different magnitudes
+    column_norms = numpy.linalg.norm(A, axis=0)
+    column_norms[column_norms == 0] = 1
+    A /= column_norms
     # perform least squares fit
     sol, residuals, rank, sing_values = numpy.linalg.lstsq(A, z, rcond=rcond)
+    sol /= column_norms
     # NB: it seems like this problem is not always well-conditioned (TimeCOAPoly, at least)
     if len(residuals) != 0:
         residuals /= float(x.size)
@@ -109,6 +126,42 @@ def two_dim_poly_fit(x, y, z, x_order=2, y_order=2, x_scale=1, y_scale=1, rcond=
     return sol, residuals, rank, sing_values
 
 
+_UNIT_GRID_PINV = {}
+
+
+def _get_unit_grid_pinv(x_order, y_order, grid_samples):
+    """
+    Gets the (cached) pseudo-inverse of the design matrix for the two dimensional
+    polynomial fit of the given orders over the `grid_samples x grid_samples` grid
+    of evenly spaced points in `[0, 1]x[0, 1]`, raveled in C order.
+
+    Parameters
+    ----------
+    x_order : int
+    y_order : int
+    grid_samples : int
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray, int, numpy.ndarray)
+        The design matrix, its pseudo-inverse, its rank, and its singular values.
+    """
+
+    key = (x_order, y_order, grid_samples)
+    entry = _UNIT_GRID_PINV.get(key, None)
+    if entry is None:
+        unit = numpy.linspace(0, 1, grid_samples, dtype=numpy.float64)
+        # NB: for the C ordered grid, the design matrix is the Kronecker product of the Vandermonde matrices
+        A = numpy.kron(numpy.vander(unit, x_order+1, increasing=True), numpy.vander(unit, y_order+1, increasing=True))
+        U, sing_values, Vt = numpy.linalg.svd(A, full_matrices=False)
+        # discard the directions of negligible singular values, as numpy.linalg.lstsq
+        keep = sing_values > numpy.finfo(numpy.float64).eps*max(A.shape)*sing_values[0]
+        pinv = (Vt[keep, :].T/sing_values[keep]).dot(U[:, keep].T)
+        entry = (A, pinv, int(numpy.count_nonzero(keep)), sing_values)
+        _UNIT_GRID_PINV[key] = entry
+    return entry
+
+
 def get_im_physical_coords(array, grid, image_data, direction):
     """
     Converts one dimension of "pixel" image (row or column) coordinates to
@@ -136,7 +189,7 @@ def get_im_physical_coords(array, grid, image_data, direction):
         raise ValueError('Unrecognized direction {}'.format(direction))
 
 
-def fit_time_coa_polynomial(inca, image_data, grid, dop_rate_scaled_coeffs, poly_order=2):
+def fit_time_coa_polynomial(inca, image_data, grid, dop_rate_scaled_coeffs, poly_order=2, grid_samples=None):
     """
 
     Parameters
@@ -149,26 +202,56 @@ def fit_time_coa_polynomial(inca, image_data, grid, dop_rate_scaled_coeffs, poly
         common construct in converting metadata for csk/sentinel/radarsat
     poly_order : int
         the degree of the polynomial to fit.
+    grid_samples : None|int
+        the number of samples along each axis of the grid to which the polynomial
+        is fit. This defaults to `poly_order + 3`, and must be at least `poly_order + 1`.
     Returns
     -------
     Poly2DType
     """
 
-    grid_samples = poly_order + 3
-    coords_az = get_im_physical_coords(
-        numpy.linspace(0, image_data.NumCols - 1, grid_samples, dtype=numpy.float64), grid, image_data, 'col')
-    coords_rg = get_im_physical_coords(
-        numpy.linspace(0, image_data.NumRows - 1, grid_samples, dtype=numpy.float64), grid, image_data, 'row')
-    coords_az_2d, coords_rg_2d = numpy.meshgrid(coords_az, coords_rg)
-    time_ca_sampled = inca.TimeCAPoly(coords_az_2d)
-    dop_centroid_sampled = inca.DopCentroidPoly(coords_rg_2d, coords_az_2d)
-    doppler_rate_sampled = polynomial.polyval(coords_rg_2d, dop_rate_scaled_coeffs)
-    time_coa_sampled = time_ca_sampled + dop_centroid_sampled / doppler_rate_sampled
-    coefs, residuals, rank, sing_values = two_dim_poly_fit(
-        coords_rg_2d, coords_az_2d, time_coa_sampled,
-        x_order=poly_order, y_order=poly_order, x_scale=1e-3, y_scale=1e-3, rcond=1e-40)
+    if grid_samples is None:
+        grid_samples = poly_order + 3
+    elif grid_samples < poly_order + 1:
+        raise ValueError(
+            'grid_samples must be at least poly_order + 1 = {}, got {}'.format(poly_order + 1, grid_samples))
+
+    # NB: this is get_im_physical_coords, with the descriptor lookups done
+    #   once, for the sample positions spread evenly from the first to last pixel
+    scp_pixel = image_data.SCPPixel
+    unit = numpy.linspace(0, 1, grid_samples, dtype=numpy.float64)
+    coords_az = (unit*(image_data.NumCols - 1) - scp_pixel.Col)*grid.Col.SS
+    coords_rg = (unit*(image_data.NumRows - 1) - scp_pixel.Row)*grid.Row.SS
+    # the grid with range along the first axis - these are (read only) broadcast views, not copies
+    coords_az_2d, coords_rg_2d = numpy.broadcast_arrays(coords_az[numpy.newaxis, :], coords_rg[:, numpy.newaxis])
+    # time_coa = time_ca + dop_centroid/doppler_rate, accumulated in place
+    time_coa_sampled = inca.DopCentroidPoly(coords_rg_2d, coords_az_2d)
+    # NB: the doppler rate only depends on range, and time_ca only on azimuth,
+    #   so evaluate each along its axis and broadcast
+    time_coa_sampled /= polynomial.polyval(coords_rg, dop_rate_scaled_coeffs)[:, numpy.newaxis]
+    time_coa_sampled += inca.TimeCAPoly(coords_az)[numpy.newaxis, :]
+
+    rg_extent = coords_rg[-1] - coords_rg[0]
+    az_extent = coords_az[-1] - coords_az[0]
+    if rg_extent == 0 or az_extent == 0:
+        coefs, residuals, rank, sing_values = two_dim_poly_fit(
+            coords_rg_2d, coords_az_2d, time_coa_sampled,
+            x_order=poly_order, y_order=poly_order, x_scale=1e-3, y_scale=1e-3)
+        time_coa_poly = Poly2DType(Coefs=coefs)
+    else:
+        # the sample grid is the affine image of the fixed unit grid, so fit there using the
+        #   cached pseudo-inverse, and then transform the fit into physical coordinates
+        A, pinv, rank, sing_values = _get_unit_grid_pinv(poly_order, poly_order, grid_samples)
+        z = time_coa_sampled.ravel()
+        sol = pinv.dot(z)
+        residuals = numpy.sum((A.dot(sol) - z)**2, keepdims=True)/float(z.size)
+        unit_poly = Poly2DType(Coefs=numpy.reshape(sol, (poly_order+1, poly_order+1)))
+        # NB: the unit coordinate u = (coords - coords[0])/extent = coords/extent - coords[0]/extent
+        time_coa_poly = unit_poly.shift(
+            t1_shift=coords_rg[0]/rg_extent, t1_scale=1./rg_extent,
+            t2_shift=coords_az[0]/az_extent, t2_scale=1./az_extent, return_poly=True)
     logging.info('The time_coa_fit details:\nroot mean square residuals = {}\nrank = {}\nsingular values = {}'.format(residuals, rank, sing_values))
-    return Poly2DType(Coefs=coefs)
+    return time_coa_poly
 
 
 def parse_xml_from_string(xml_string):
@@ -184,9 +267,11 @@ def parse_xml_from_string(xml_string):
     (ElementTree.Element, dict)
     """
 
-    root_node = ElementTree.fromstring(xml_string)
-    # define the namespace dictionary
-    xml_ns = dict([node for _, node in ElementTree.iterparse(StringIO(xml_string), events=('start-ns',))])
+    stream = BytesIO(xml_string) if isinstance(xml_string, bytes) else StringIO(xml_string)
+    # parse the tree and define the namespace dictionary in a single pass
+    context = ElementTree.iterparse(stream, events=('start-ns', ))
+    xml_ns = dict(node for _, node in context)
+    root_node = context.root
     if len(xml_ns.keys()) == 0:
         xml_ns = None
     elif '' in xml_ns:
@@ -194,6 +279,25 @@ def parse_xml_from_string(xml_string):
     return root_node, xml_ns
 
 
+# we have empirically fit so that
+#   rniirs = a_0 + a_1*log_2(information_density)
+_RNIIRS_A = (3.7555, .3960)
+
+# note that if information_density is sufficiently small, it will
+# result in negative values in the above functional form. This would be
+# invalid for RNIIRS by definition, so we must avoid this case.
+
+# We transition to a linear function of information_density
+# below a certain point. This point will be chosen to be the (unique) point
+# at which the line tangent to the curve intersects the origin, and the
+# linear approximation below that point will be defined by this tangent line.
+
+# via calculus, we can determine analytically where that happens
+# rniirs_transition = a_1/numpy.log(2)
+_IIM_TRANSITION = float(numpy.exp(1 - numpy.log(2)*_RNIIRS_A[0]/_RNIIRS_A[1]))
+_RNIIRS_LINEAR_SLOPE = float(_RNIIRS_A[1]/(_IIM_TRANSITION*numpy.log(2)))
+
+
 def snr_to_rniirs(bandwidth_area, signal, noise):
     """
     Calculate the information_density and RNIIRS estimate from bandwidth area and
@@ -208,37 +312,25 @@ def snr_to_rniirs(bandwidth_area, signal, noise):
 
     Parameters
     ----------
-    bandwidth_area : float
-    signal : float
-    noise : float
+    bandwidth_area : float|numpy.ndarray
+    signal : float|numpy.ndarray
+    noise : float|numpy.ndarray
+        The arguments may be arrays of broadcast compatible shape, to estimate
+        many values in one pass.
 
     Returns
     -------
-    (float, float)
+    (float, float)|(numpy.ndarray, numpy.ndarray)
         The information_density and RNIIRS
     """
 
     information_density = bandwidth_area*numpy.log2(1 + signal/noise)
 
-    a = numpy.array([3.7555, .3960], dtype=numpy.float64)
-    # we have empirically fit so that
-    #   rniirs = a_0 + a_1*log_2(information_density)
-
-    # note that if information_density is sufficiently small, it will
-    # result in negative values in the above functional form. This would be
-    # invalid for RNIIRS by definition, so we must avoid this case.
-
-    # We transition to a linear function of information_density
-    # below a certain point. This point will be chosen to be the (unique) point
-    # at which the line tangent to the curve intersects the origin, and the
-    # linear approximation below that point will be defined by this tangent line.
-
-    # via calculus, we can determine analytically where that happens
-    # rniirs_transition = a[1]/numpy.log(2)
-    iim_transition = numpy.exp(1 - numpy.log(2)*a[0]/a[1])
-    slope = a[1]/(iim_transition*numpy.log(2))
-
-    if information_density > iim_transition:
-        return information_density, a[0] + a[1]*numpy.log2(information_density)
-    else:
-        return information_density, slope*information_density
+    # NB: the logarithm is clipped to the transition point, where it is unused, to avoid
+    #   evaluating it for zero or negative information_density
+    rniirs = numpy.where(
+        information_density > _IIM_TRANSITION,
+        _RNIIRS_A[0] + _RNIIRS_A[1]*numpy.log2(numpy.maximum(information_density, _IIM_TRANSITION)),
+        _RNIIRS_LINEAR_SLOPE*information_density)
+    # reduce the zero-dimensional array for scalar arguments to a numpy scalar
+    return information_density, rniirs[()]
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import numpy
+
 from ..tre_elements import TREExtension, TREElement
 
 __classification__ = "UNCLASSIFIED"
@@ -16,3 +18,28 @@ class OFFSETType(TREElement):
 class OFFSET(TREExtension):
     _tag_value = 'OFFSET'
     _data_type = OFFSETType
+
+    @classmethod
+    def parse_many(cls, value, count):
+        """
+        Parse the data of `count` consecutive OFFSET TREs (without the TRE headers)
+        into a single structured array, rather than one OFFSETType object per TRE.
+
+        Parameters
+        ----------
+        value : bytes
+            The concatenated data of the OFFSET TREs.
+        count : int
+            The number of OFFSET TREs.
+
+        Returns
+        -------
+        numpy.ndarray
+            Of structured dtype with int64 fields `LINE` and `SAMPLE`, and shape `(count, )`.
+        """
+
+        raw = numpy.frombuffer(value, dtype=numpy.dtype([('LINE', 'S8'), ('SAMPLE', 'S8')]), count=count)
+        out = numpy.empty((count, ), dtype=numpy.dtype([('LINE', 'int64'), ('SAMPLE', 'int64')]))
+        out['LINE'] = raw['LINE'].astype('int64')
+        out['SAMPLE'] = raw['SAMPLE'].astype('int64')
+        return out
@@ -1,3 +1,4 @@
+import copy
 import numpy
 from sarpy.io.complex.sicd_elements import blocks
 
@@ -32,6 +33,25 @@ def generic_arrayable_construction_test(instance, the_type, the_dict, array):
     return the_item
 
 
+def generic_bulk_array_test(instance, the_type, array):
+    items = the_type.bulk_from_array(array)
+    with instance.subTest(msg='bulk_from_array test'):
+        instance.assertEqual(len(items), array.shape[0])
+        for item, row in zip(items, array):
+            instance.assertTrue(numpy.all(item.get_array(dtype=array.dtype) == row))
+
+    with instance.subTest(msg='bulk_to_array test'):
+        array2 = the_type.bulk_to_array(items, dtype=array.dtype)
+        instance.assertTrue(numpy.all(array == array2), msg='{} != {}'.format(array, array2))
+
+    with instance.subTest(msg='bulk_to_array empty test'):
+        instance.assertEqual(the_type.bulk_to_array([]).shape, (0, array.shape[1]))
+
+    with instance.subTest(msg='bulk_from_array bad shape test'):
+        with instance.assertRaises(ValueError):
+            the_type.bulk_from_array(array[0])
+
+
 class TestXYZType(unittest.TestCase):
     def test_construction(self):
         the_dict = {'X': 1, 'Y': 2, 'Z': 3}
@@ -41,6 +61,22 @@ class TestXYZType(unittest.TestCase):
         with self.subTest(msg='Comparing from dict construction with alternate construction'):
             self.assertEqual(item1.to_dict(), item2.to_dict())
 
+    def test_bulk_array(self):
+        generic_bulk_array_test(self, blocks.XYZType, numpy.arange(12, dtype=numpy.float64).reshape((4, 3)))
+
+    def test_from_array_errors(self):
+        for bad in [[1, 2], numpy.array([1., 2.]), 'abc', 3]:
+            with self.subTest(msg='from_array of {}'.format(bad)):
+                with self.assertRaises(ValueError):
+                    blocks.XYZType.from_array(bad)
+
+    def test_slots(self):
+        item = blocks.XYZType(X=1, Y=2, Z=3, _xml_ns={'sicd': 'urn:SICD:1.2.1'})
+        self.assertFalse(hasattr(item, '__dict__'))
+        item2 = copy.deepcopy(item)
+        self.assertEqual(item.to_dict(), item2.to_dict())
+        self.assertEqual(item._xml_ns, item2._xml_ns)
+
 
 class TestLatLon(unittest.TestCase):
     def test_construction(self):
@@ -51,6 +87,26 @@ class TestLatLon(unittest.TestCase):
         with self.subTest(msg='Comparing from dict construction with alternate construction'):
             self.assertEqual(item1.to_dict(), item2.to_dict())
 
+    def test_bulk_array(self):
+        generic_bulk_array_test(self, blocks.LatLonType, numpy.arange(8, dtype=numpy.float64).reshape((4, 2)))
+
+    def test_array_order(self):
+        item = blocks.LatLonType(Lat=1, Lon=2)
+        for order, expected in [('LAT', [1, 2]), ('lat', [1, 2]), ('LON', [2, 1]), ('Lon', [2, 1])]:
+            with self.subTest(msg='order {}'.format(order)):
+                self.assertEqual(item.get_array(order=order).tolist(), expected)
+        item = blocks.LatLonHAEType(Lat=1, Lon=2, HAE=3)
+        self.assertEqual(item.get_array(order='Lat').tolist(), [1, 2, 3])
+        self.assertEqual(item.get_array(order='LON').tolist(), [2, 1, 3])
+
+    def test_dms_format(self):
+        item = blocks.LatLonType(Lat=-10.5, Lon=20.25)
+        self.assertEqual(item.dms_format(), ((10, 30, 0, 'S'), (20, 15, 0, 'E')))
+        lat, lon = blocks.LatLonType(Lat=-10.5125, Lon=20.25).dms_format(frac_secs=True)
+        self.assertEqual(lat[:2] + lat[3:], (10, 30, 'S'))
+        self.assertAlmostEqual(lat[2], 45.0)
+        self.assertEqual(blocks.LatLonType(Lat=0, Lon=-1).dms_format(), ((0, 0, 0, 'N'), (1, 0, 0, 'W')))
+
 
 class TestLatLonRestriction(unittest.TestCase):
     def test_construction(self):
@@ -61,6 +117,12 @@ class TestLatLonRestriction(unittest.TestCase):
         with self.subTest(msg='Comparing from dict construction with alternate construction'):
             self.assertEqual(item1.to_dict(), item2.to_dict())
 
+    def test_bulk_array(self):
+        # the restricted descriptors must still be applied in the bulk construction
+        items = blocks.LatLonRestrictionType.bulk_from_array(numpy.array([[91, -182], [-89, 178]]))
+        for item in items:
+            self.assertEqual(item.to_dict(), {'Lat': -89, 'Lon': 178})
+
 
 class TestLatLonArrayElement(unittest.TestCase):
     def test_construction(self):
@@ -81,6 +143,9 @@ class TestLatLonHAE(unittest.TestCase):
         with self.subTest(msg='Comparing from dict construction with alternate construction'):
             self.assertEqual(item1.to_dict(), item2.to_dict())
 
+    def test_bulk_array(self):
+        generic_bulk_array_test(self, blocks.LatLonHAEType, numpy.arange(12, dtype=numpy.float64).reshape((4, 3)))
+
 
 class TestLatLonHAERestriction(unittest.TestCase):
     def test_construction(self):
@@ -121,6 +186,9 @@ class TestRowCol(unittest.TestCase):
         with self.subTest(msg='Comparing from dict construction with alternate construction'):
             self.assertEqual(item1.to_dict(), item2.to_dict())
 
+    def test_bulk_array(self):
+        generic_bulk_array_test(self, blocks.RowColType, numpy.arange(8, dtype=numpy.int64).reshape((4, 2)))
+
 
 class TestRowColArrayElement(unittest.TestCase):
     def test_construction(self):
@@ -145,6 +213,43 @@ class TestPoly1D(unittest.TestCase):
         item = blocks.Poly1DType(Coefs=[0, 1, 2])
         self.assertEqual(item(1), 3)
 
+        item = blocks.Poly1DType(Coefs=[1.5, -2, 0.25, 3])
+        for x in [2.5, 3, 1 - 2j, [0, 1, 2], numpy.arange(4), numpy.linspace(-1, 1, 7).reshape((7, 1))]:
+            with self.subTest(msg='Comparing with polyval for {}'.format(x)):
+                calc = item(x)
+                expected = numpy.polynomial.polynomial.polyval(x, item.Coefs)
+                self.assertEqual(numpy.shape(calc), numpy.shape(expected))
+                self.assertTrue(numpy.allclose(calc, expected))
+
+        item = blocks.Poly1DType(Coefs=[6878137., 12.3, 0.01])
+        x = numpy.linspace(0, 10, 5, dtype='float32')
+        expected = numpy.polynomial.polynomial.polyval(x.astype('float64'), item.Coefs)
+        with self.subTest(msg='Evaluation for float32 array is in double precision'):
+            calc = item(x)
+            self.assertEqual(calc.dtype, numpy.float64)
+            self.assertTrue(numpy.all(calc == expected))
+        with self.subTest(msg='Evaluation for float32 scalar is in double precision'):
+            self.assertEqual(item(x[-1]), expected[-1])
+        with self.subTest(msg='Derivative evaluation for float32 array is in double precision'):
+            calc = item.derivative_eval(x)
+            self.assertEqual(calc.dtype, numpy.float64)
+            self.assertTrue(numpy.allclose(calc, 12.3 + 0.02*x.astype('float64'), rtol=0, atol=1e-12))
+
+    def test_evaluate_many(self):
+        item = blocks.Poly1DType(Coefs=[1.5, -2, 0.25, 3])
+        x = numpy.linspace(-2, 2, 12).reshape((3, 4))
+        expected = numpy.polynomial.polynomial.polyval(x, item.Coefs)
+        with self.subTest(msg='Allocated output'):
+            self.assertTrue(numpy.allclose(item.evaluate_many(x), expected))
+        with self.subTest(msg='Provided output'):
+            out = numpy.empty((3, 4), dtype=numpy.float64)
+            result = item.evaluate_many(x, out=out)
+            self.assertIs(result, out)
+            self.assertTrue(numpy.allclose(out, expected))
+        with self.subTest(msg='Mismatched output'):
+            with self.assertRaises(ValueError):
+                item.evaluate_many(x, out=numpy.empty((12, ), dtype=numpy.float64))
+
     def test_derivative(self):
         item = blocks.Poly1DType(Coefs=[0, 1, 2])
         dcoef = numpy.array([1, 4])
@@ -154,6 +259,15 @@ class TestPoly1D(unittest.TestCase):
         item2 = item.derivative(der_order=2, return_poly=True)
         self.assertTrue(numpy.all(item2.Coefs == numpy.array([4, ])))
 
+        with self.subTest(msg='Derivative cache follows coefficient changes'):
+            item.Coefs[1] = 3
+            self.assertEqual(item.derivative_eval(1, 1), 7)
+            item.Coefs = [0, 0, 0, 1]
+            self.assertEqual(item.derivative_eval(1, 1), 3)
+            calc_dcoefs = item.derivative(der_order=1, return_poly=False)
+            calc_dcoefs[0] = 100
+            self.assertEqual(item.derivative_eval(1, 1), 3)
+
     def test_shift(self):
         array1 = numpy.array([1, 2, 1], dtype=numpy.float64)
         array2 = numpy.array([0, 0, 1], dtype=numpy.float64)
@@ -174,6 +288,25 @@ class TestPoly1D(unittest.TestCase):
             shift_scale = item.shift(1, alpha=2, return_poly=False)
             self.assertTrue(
                 numpy.all(shift_scale == array4), msg='calculated {}\nexpected {}'.format(shift_scale, array4))
+        with self.subTest(msg="Shift and scale higher order"):
+            item = blocks.Poly1DType(Coefs=[0.5, -1.25, 2, 0.75, -0.125, 0.0625])
+            shifted = item.shift(-3.5, alpha=0.25, return_poly=True)
+            x = numpy.linspace(-4, 4, 9)
+            self.assertTrue(numpy.allclose(shifted(x), item(0.25*x + 3.5)))
+        with self.subTest(msg="Shift into provided buffer"):
+            item = blocks.Poly1DType(Coefs=array1)
+            out = numpy.empty((3, ), dtype=numpy.float64)
+            shift_scale = item.shift(1, alpha=2, return_poly=False, out=out)
+            self.assertIs(shift_scale, out)
+            self.assertTrue(numpy.all(out == array4))
+        with self.subTest(msg="Identity shift without copy"):
+            item = blocks.Poly1DType(Coefs=array1)
+            self.assertIsNot(item.shift(0, alpha=1), item.Coefs)
+            self.assertIs(item.shift(0, alpha=1, copy=False), item.Coefs)
+            self.assertIsNot(item.shift(1, alpha=1, copy=False), item.Coefs)
+            self.assertTrue(numpy.all(item.shift(0, alpha=2, out=out) == array3))
+            with self.assertRaises(ValueError):
+                item.shift(1, out=numpy.empty((2, ), dtype=numpy.float64))
 
 
 class TestPoly2D(unittest.TestCase):
@@ -190,6 +323,70 @@ class TestPoly2D(unittest.TestCase):
         item = blocks.Poly2DType(Coefs=[[0, 0, 0], [0, 1, 2]])
         self.assertEqual(item(1, 1), 3)
 
+        coefs = numpy.array([[1, -2, 0.5], [0.25, 1, 2], [3, 0, -1], [0.5, 0.125, 1]])
+        item = blocks.Poly2DType(Coefs=coefs)
+        x = numpy.linspace(-1, 1, 12).reshape((3, 4))
+        y = numpy.linspace(-2, 1, 12).reshape((3, 4))
+        with self.subTest(msg='Scalar evaluation'):
+            self.assertAlmostEqual(item(0.5, -1.5), numpy.polynomial.polynomial.polyval2d(0.5, -1.5, coefs))
+        with self.subTest(msg='Array evaluation'):
+            self.assertTrue(numpy.allclose(item(x, y), numpy.polynomial.polynomial.polyval2d(x, y, coefs)))
+        with self.subTest(msg='List evaluation'):
+            self.assertTrue(numpy.allclose(item([0, 1], [2, 3]), numpy.polynomial.polynomial.polyval2d([0, 1], [2, 3], coefs)))
+        with self.subTest(msg='Complex x with real y'):
+            x_complex = numpy.array([1 + 1j, 2])
+            y_real = numpy.array([1., 2])
+            self.assertTrue(numpy.allclose(
+                item(x_complex, y_real), numpy.polynomial.polynomial.polyval2d(x_complex, y_real, coefs)))
+        with self.subTest(msg='Real x with complex y'):
+            self.assertTrue(numpy.allclose(
+                item(y_real, x_complex), numpy.polynomial.polynomial.polyval2d(y_real, x_complex, coefs)))
+        with self.subTest(msg='Evaluation for float32 arrays is in double precision'):
+            big_item = blocks.Poly2DType(Coefs=[[6878137., 12.3], [0.01, 1.]])
+            x32 = numpy.linspace(0, 10, 5, dtype='float32')
+            y32 = numpy.linspace(-5, 5, 5, dtype='float32')
+            calc = big_item(x32, y32)
+            self.assertEqual(calc.dtype, numpy.float64)
+            self.assertTrue(numpy.allclose(
+                calc, numpy.polynomial.polynomial.polyval2d(
+                    x32.astype('float64'), y32.astype('float64'), big_item.Coefs), rtol=0, atol=1e-8))
+        with self.subTest(msg='Mismatched shapes'):
+            self.assertRaises(ValueError, item, x, y[0])
+
+    def test_evaluate_on_grid(self):
+        coefs = numpy.array([[1, -2, 0.5], [0.25, 1, 2], [3, 0, -1], [0.5, 0.125, 1]])
+        item = blocks.Poly2DType(Coefs=coefs)
+        x = numpy.linspace(-1, 1, 5)
+        y = numpy.linspace(-2, 1, 6)
+        with self.subTest(msg='One-dimensional grid'):
+            value = item.evaluate_on_grid(x, y)
+            self.assertEqual(value.shape, (5, 6))
+            self.assertTrue(numpy.allclose(value, numpy.polynomial.polynomial.polygrid2d(x, y, coefs)))
+        with self.subTest(msg='Multidimensional grid'):
+            value = item.evaluate_on_grid(x.reshape((5, 1)), y.reshape((2, 3)))
+            self.assertEqual(value.shape, (5, 1, 2, 3))
+            self.assertTrue(numpy.allclose(value.reshape((5, 6)), numpy.polynomial.polynomial.polygrid2d(x, y, coefs)))
+        with self.subTest(msg='Constant polynomial'):
+            value = blocks.Poly2DType(Coefs=[[2, ], ]).evaluate_on_grid(x, y)
+            self.assertTrue(numpy.all(value == 2))
+
+    def test_shift(self):
+        item = blocks.Poly2DType(Coefs=[[1, -2, 0.5], [0.25, 1, 2], [3, 0, -1], [0.5, 0.125, 1]])
+        x = numpy.linspace(-1, 1, 5)
+        y = numpy.linspace(-2, 1, 5)
+        with self.subTest(msg='Shift and scale along both axes'):
+            shifted = item.shift(t1_shift=0.5, t1_scale=2, t2_shift=-1.5, t2_scale=0.5, return_poly=True)
+            self.assertTrue(numpy.allclose(shifted(x, y), item(2*x - 0.5, 0.5*y + 1.5)))
+        with self.subTest(msg='Shift along second axis only'):
+            shifted = item.shift(t2_shift=2, return_poly=True)
+            self.assertTrue(numpy.allclose(shifted(x, y), item(x, y - 2)))
+        with self.subTest(msg='Identity shift copies'):
+            shifted = item.shift(return_poly=False)
+            self.assertTrue(numpy.all(shifted == item.Coefs))
+            self.assertIsNot(shifted, item.Coefs)
+        with self.subTest(msg='Identity shift without copy'):
+            self.assertIs(item.shift(return_poly=False, copy=False), item.Coefs)
+
 
 class TestXYZPoly(unittest.TestCase):
     def test_construction(self):
@@ -201,12 +398,41 @@ class TestXYZPoly(unittest.TestCase):
         with self.subTest(msg='Comparing from dict construction with alternate construction'):
             self.assertEqual(item1.to_dict(), item2.to_dict())
 
+    def test_object_array(self):
+        item = blocks.XYZPolyType(X=[0, 1, 2], Y=[0, 2, 4], Z=[0, 3, 6])
+        array = item.get_array()
+        self.assertEqual(array.shape, (3, ))
+        self.assertIs(array[0], item.X)
+        self.assertIs(array[2], item.Z)
+
     def test_eval(self):
         item = blocks.XYZPolyType(X=[0, 1, 2], Y=[0, 2, 4], Z=[0, 3, 6])
         t = numpy.array([0, 1])
         out = numpy.array([[0, 0, 0], [3, 6, 9]])
         self.assertTrue(numpy.all(item(t) == out))
 
+        with self.subTest(msg='Scalar evaluation'):
+            self.assertEqual(item(1).tolist(), [3, 6, 9])
+        with self.subTest(msg='Multidimensional evaluation'):
+            t = numpy.arange(6).reshape((2, 3))
+            value = item(t)
+            self.assertEqual(value.shape, (2, 3, 3))
+            self.assertTrue(numpy.all(value[..., 1] == item.Y(t)))
+
+    def test_evaluate_stacked(self):
+        item = blocks.XYZPolyType(X=[0, 1, 2], Y=[0, 2, 4], Z=[0, 3, 6])
+        t = numpy.arange(6, dtype='float64').reshape((2, 3))
+        value = item.evaluate_stacked(t)
+        self.assertEqual(value.shape, (3, 2, 3))
+        self.assertTrue(numpy.all(value[2] == item.Z(t)))
+
+        with self.subTest(msg='Output buffer'):
+            out = numpy.empty((3, 2, 3))
+            self.assertIs(item.evaluate_stacked(t, out=out), out)
+            self.assertTrue(numpy.all(out == value))
+        with self.subTest(msg='Output buffer of the wrong shape'):
+            self.assertRaises(ValueError, item.evaluate_stacked, t, out=numpy.empty((3, 6)))
+
     def test_derivative(self):
         item = blocks.XYZPolyType(X=[0, 1, 2], Y=[0, 2, 4], Z=[0, 3, 6])
         dcoef = [numpy.array([1, 4]), 2*numpy.array([1, 4]), 3*numpy.array([1, 4])]
@@ -221,6 +447,17 @@ class TestXYZPoly(unittest.TestCase):
                         numpy.all(item2.Z.Coefs == numpy.array([12, ]))
                         )
 
+    def test_shift(self):
+        x = numpy.linspace(-4, 4, 9)
+        with self.subTest(msg='Components of the same order'):
+            item = blocks.XYZPolyType(X=[0.5, -1.25, 2], Y=[1, 0.25, -3], Z=[2, 1, 0.125])
+            shifted = item.shift(-3.5, alpha=0.25, return_poly=True)
+            self.assertTrue(numpy.allclose(shifted(x), item(0.25*x + 3.5)))
+        with self.subTest(msg='Components of different orders'):
+            item = blocks.XYZPolyType(X=[0.5, -1.25, 2], Y=[1, 0.25], Z=[2, 1, 0.125, 0.5])
+            shifted = item.shift(-3.5, alpha=0.25, return_poly=True)
+            self.assertTrue(numpy.allclose(shifted(x), item(0.25*x + 3.5)))
+
 
 class TestGainPhasePoly(unittest.TestCase):
     def test_construction(self):
@@ -235,6 +472,22 @@ class TestGainPhasePoly(unittest.TestCase):
         item = blocks.GainPhasePolyType(GainPoly=[[1, ], ], PhasePoly=[[2, ], ])
         self.assertTrue(numpy.all(item(1, 1) == numpy.array([1, 2])))
 
+        gain = numpy.array([[0, 0.5, -1], [1, 0.25, 2], [-0.5, 1, 0.125]])
+        phase = numpy.array([[0, -2, 0.75], [0.5, 1, -1], [3, 0.25, 1]])
+        x = numpy.linspace(-1, 1, 12).reshape((3, 4))
+        y = numpy.linspace(-0.5, 1, 12).reshape((3, 4))
+        with self.subTest(msg='Array evaluation'):
+            item = blocks.GainPhasePolyType(GainPoly=gain, PhasePoly=phase)
+            value = item(x, y)
+            self.assertEqual(value.shape, (2, 3, 4))
+            self.assertTrue(numpy.allclose(value[0], item.GainPoly(x, y)))
+            self.assertTrue(numpy.allclose(value[1], item.PhasePoly(x, y)))
+        with self.subTest(msg='Array evaluation with different orders'):
+            item = blocks.GainPhasePolyType(GainPoly=gain, PhasePoly=phase[:2, :])
+            value = item(x, y)
+            self.assertTrue(numpy.allclose(value[0], item.GainPoly(x, y)))
+            self.assertTrue(numpy.allclose(value[1], item.PhasePoly(x, y)))
+
 
 class TestErrorDecorrFunc(unittest.TestCase):
     def test_construction(self):
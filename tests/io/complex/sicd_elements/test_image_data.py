@@ -55,3 +55,11 @@ class TestImageData(unittest.TestCase):
 
         with self.subTest(msg='Limits on PixelType'):
             self.assertRaises(ValueError, ImageData.ImageDataType, PixelData='bad_value')
+
+    def test_vertex_data(self):
+        item1 = ImageData.ImageDataType.from_dict(image_data_dict)
+        valid = item1.get_valid_vertex_data(dtype=numpy.float64)
+        self.assertEqual(valid.dtype, numpy.float64)
+        self.assertTrue(numpy.all(valid == numpy.array([[0, 1], [0, 7], [3, 7], [3, 1]])))
+        full = item1.get_full_vertex_data()
+        self.assertTrue(numpy.all(full == numpy.array([[0, 0], [0, 9], [9, 9], [9, 0]])))
@@ -1,4 +1,6 @@
+import copy
 
+import numpy
 from sarpy.io.complex.sicd_elements import SICD
 
 from . import generic_construction_test, unittest
@@ -40,6 +42,26 @@ sicd_dict = {
 }
 
 
+def get_projection_sicd(sample_spacing):
+    """
+    Gets a sicd with simple, consistent geometry for projection tests. The SCP is on
+    the equator, the PLANE grid is tangent to the earth there and the platform moves north.
+    """
+
+    the_dict = copy.deepcopy(sicd_dict)
+    the_dict['GeoData']['SCP'] = {'ECF': {'X': 6378137., 'Y': 0, 'Z': 0}, 'LLH': {'Lat': 0, 'Lon': 0, 'HAE': 0}}
+    the_dict['Position'] = {'ARPPoly': {'X': {'Coefs': [6878137.]}, 'Y': {'Coefs': [300e3]},
+                                        'Z': {'Coefs': [-35e3, 7000.]}}}
+    the_dict['SCPCOA'] = dict(the_dict['SCPCOA'], ARPPos={'X': 6878137., 'Y': 300e3, 'Z': 0},
+                              ARPVel={'X': 0, 'Y': 0, 'Z': 7000.}, SideOfTrack='R')
+    the_dict['Grid']['Type'] = 'PLANE'
+    the_dict['Grid']['TimeCOAPoly'] = {'Coefs': [[5.]]}
+    the_dict['Grid']['Row'] = dict(the_dict['Grid']['Row'], UVectECF={'X': 0, 'Y': 1, 'Z': 0}, SS=sample_spacing)
+    the_dict['Grid']['Col'] = dict(the_dict['Grid']['Col'], UVectECF={'X': 0, 'Y': 0, 'Z': 1}, SS=sample_spacing)
+    the_dict['ImageData'].update({'FirstRow': 0, 'FirstCol': 0, 'SCPPixel': {'Row': 5, 'Col': 5}})
+    return SICD.SICDType.from_dict(the_dict)
+
+
 # def generic_construction_test(instance, the_type, the_dict, tag='The_Type', print_xml=False, print_json=False):
 #     if not issubclass(the_type, Serializable):
 #         raise TypeError('Class {} must be a subclass of Serializable'.format(the_type))
@@ -110,3 +132,171 @@ class TestSICD(unittest.TestCase):
         item1.ImageFormation.ImageFormAlgo = 'PFA'
         # SICD does not have the PFA item set, so this should warn us
         self.assertFalse(item1.is_valid())
+
+    def test_image_form_type_cache(self):
+        the_dict = sicd_dict.copy()
+        item1 = SICD.SICDType.from_dict(the_dict)
+        self.assertEqual(item1.ImageFormType, 'OTHER')
+        item1.PFA = pfa_dict
+        self.assertEqual(item1.ImageFormType, 'PFA')
+        item1.PFA = None
+        self.assertEqual(item1.ImageFormType, 'OTHER')
+
+    def test_can_project_missing_element(self):
+        the_dict = sicd_dict.copy()
+        item1 = SICD.SICDType.from_dict(the_dict)
+        item1.GeoData.SCP = None
+        item1.Position = None
+        with self.assertLogs(level='ERROR') as logs:
+            self.assertFalse(item1.can_project_coordinates())
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('not populated: GeoData.SCP, Position', logs.output[0])
+
+    def test_spotlight_mode_validation(self):
+        the_dict = sicd_dict.copy()
+        item1 = SICD.SICDType.from_dict(the_dict)
+        self.assertTrue(item1._validate_spotlight_mode())
+        item1.Grid.TimeCOAPoly = [[0, 1], [1, 0]]
+        self.assertFalse(item1._validate_spotlight_mode())
+
+    def test_derive_repeat(self):
+        the_dict = sicd_dict.copy()
+        item1 = SICD.SICDType.from_dict(the_dict)
+        item1.derive()
+        self.assertTrue(item1._derived)
+        item1.RadarCollection = item1.RadarCollection
+        self.assertFalse(item1._derived)
+
+    def test_can_project_plane_grid(self):
+        the_dict = sicd_dict.copy()
+        item1 = SICD.SICDType.from_dict(the_dict)
+        item1.Grid.Type = 'PLANE'
+        self.assertTrue(item1.can_project_coordinates())
+        item1.Grid.Row.UVectECF = None
+        self.assertFalse(item1.can_project_coordinates())
+
+    def test_deepcopy(self):
+        the_dict = sicd_dict.copy()
+        item1 = SICD.SICDType.from_dict(the_dict)
+        item2 = copy.deepcopy(item1)
+        self.assertEqual(item1.to_dict(), item2.to_dict())
+        self.assertIsNot(item1.Grid, item2.Grid)
+        self.assertIsNot(item1.ImageData.ValidData, item2.ImageData.ValidData)
+
+    def test_plane_projection_round_trip(self):
+        item1 = get_projection_sicd(1.)
+        im_points = numpy.array([[5, 5], [1, 9], [8, 2]], dtype=numpy.float64)
+        coords = item1.project_image_to_ground(im_points, projection_type='PLANE')
+        self.assertTrue(numpy.allclose(coords[1], [6378137., -4., 4.]))
+        with self.subTest(msg='ground_to_image'):
+            image_points, delta_gpn, iterations = item1.project_ground_to_image(coords)
+            self.assertTrue(numpy.allclose(image_points, im_points))
+            self.assertTrue(numpy.all(delta_gpn < 0.1))
+            self.assertTrue(numpy.all(iterations == 1))
+
+    def test_geo_projection(self):
+        item1 = get_projection_sicd(1.)
+        im_points = numpy.array([[5, 5], [1, 9], [8, 2], [0, 0], [9, 9]], dtype=numpy.float64)
+        coords = item1.project_image_to_ground_geo(im_points, projection_type='PLANE')
+        for block_size in [None, 2]:
+            with self.subTest(msg='block_size {}'.format(block_size)):
+                image_points, delta_gpn, iterations = item1.project_ground_to_image_geo(
+                    coords, block_size=block_size)
+                self.assertTrue(numpy.allclose(image_points, im_points))
+                self.assertEqual(iterations.shape, (5, ))
+
+    def test_ground_to_image_iterations(self):
+        item1 = get_projection_sicd(2000.)
+        im_points = numpy.array([[5, 5], [1, 9], [9, 9]], dtype=numpy.float64)
+        coords = item1.project_image_to_ground(im_points, projection_type='PLANE')
+        # lift the last point well above the image plane, so that it requires another iteration
+        coords[2, 0] += 8000.
+        image_points, delta_gpn, iterations = item1.project_ground_to_image(coords)
+        self.assertEqual(iterations.tolist(), [1, 1, 2])
+        self.assertTrue(numpy.all(delta_gpn < 0.1*numpy.sqrt(2)*2000.))
+        with self.subTest(msg='cached projection parameters'):
+            item1.define_coa_projection()
+            image_points2, _, _ = item1.project_ground_to_image(coords)
+            self.assertIsNotNone(item1.coa_projection.scene_to_image_parameters)
+            image_points3, _, _ = item1.project_ground_to_image(coords)
+            self.assertTrue(numpy.allclose(image_points, image_points2))
+            self.assertTrue(numpy.all(image_points2 == image_points3))
+
+    def test_projection_use_sicd_coa(self):
+        item1 = get_projection_sicd(1.)
+        item1.define_coa_projection()
+        im_points = numpy.array([[1, 9], [8, 2]], dtype=numpy.float64)
+        coords1 = item1.project_image_to_ground(im_points, projection_type='PLANE', range_bias=10.)
+        coords2 = item1.project_image_to_ground(
+            im_points, projection_type='PLANE', use_sicd_coa=False, range_bias=10.)
+        # the defined coa projection has no range bias, and is only ignored on request
+        self.assertTrue(numpy.allclose(coords1[0], [6378137., -4., 4.]))
+        self.assertFalse(numpy.allclose(coords1, coords2))
+
+    def test_hae_projection(self):
+        # NB: kilometer sample spacing, so the earth curvature matters
+        item1 = get_projection_sicd(2000.)
+        item1.define_coa_projection()
+        im_points = numpy.array([[5, 5], [1, 9], [8, 2], [0, 0], [9, 9]], dtype=numpy.float64)
+        coords = item1.project_image_to_ground(im_points, projection_type='HAE')
+        # every point should lie on its own R/Rdot contour, not only the first to converge
+        r_tgt_coa, r_dot_tgt_coa, t_coa, arp_coa, varp_coa = item1.coa_projection.projection(im_points)
+        self.assertTrue(numpy.all(numpy.abs(numpy.linalg.norm(coords - arp_coa, axis=1) - r_tgt_coa) < 1e-3))
+
+    def test_suggested_name(self):
+        the_dict = sicd_dict.copy()
+        item1 = SICD.SICDType.from_dict(the_dict)
+        for collector, expected in [
+                ('CSK2', '11Dec19CS209003'), ('RADARSAT-2', '11Dec19RS0208003'),
+                ('RCM-3', '11Dec19RC0308003'), ('SENTINEL-1A', '11Dec19SE1A00003'),
+                ('TanDEM-X', '11Dec19TD0109003'), ('tsx-1', '11Dec19TS0109003'),
+                ('unknown', '11Dec19UN0000003'),
+                # case sensitive and exact matches, as for the original naming rules
+                ('csk2', '11Dec19UN0000003'), ('Radarsat-2', '11Dec19UN0000003'),
+                ('RADARSAT-2X', '11Dec19UN0000003'), ('sentinel-1b', '11Dec19UN0000003')]:
+            with self.subTest(msg=collector):
+                item1.CollectionInfo.CollectorName = collector
+                self.assertTrue(item1.get_suggested_name(3).startswith(expected + '_'))
+
+    def test_copy_nitf(self):
+        the_dict = sicd_dict.copy()
+        item1 = SICD.SICDType.from_dict(the_dict)
+        item1._NITF = {'SUGGESTED_NAME': 'name', 'Security': {'CLAS': 'U'}}
+        item2 = item1.copy()
+        self.assertEqual(item1._NITF, item2._NITF)
+        self.assertIsNot(item1._NITF['Security'], item2._NITF['Security'])
+        item1._NITF = {'SUGGESTED_NAME': 'name', 'OSTAID': 'station'}
+        item2 = item1.copy()
+        self.assertEqual(item1._NITF, item2._NITF)
+        self.assertIsNot(item1._NITF, item2._NITF)
+
+    def test_populate_rniirs(self):
+        the_dict = sicd_dict.copy()
+        item1 = SICD.SICDType.from_dict(the_dict)
+        item1.CollectionInfo.Parameters = None
+        item1.populate_rniirs(signal=1.0, noise=0.01)
+        self.assertEqual(item1.CollectionInfo.Parameters['PREDICTED_RNIIRS'], '4.8')
+        self.assertIn('PREDICTED_RNIIRS', item1.CollectionInfo.Parameters)
+        self.assertNotIn('OTHER', item1.CollectionInfo.Parameters)
+        item1.populate_rniirs(signal=1.0, noise=0.02)
+        self.assertEqual(item1.CollectionInfo.Parameters['PREDICTED_RNIIRS'], '4.8')
+        item1.populate_rniirs(signal=1.0, noise=0.02, override=True)
+        self.assertEqual(item1.CollectionInfo.Parameters['PREDICTED_RNIIRS'], '4.7')
+        # estimate the signal from the polarization
+        for pol, expected in [('V:V', '4.8'), ('V:H', '4.6'), (None, '4.6')]:
+            item1.ImageFormation.TxRcvPolarizationProc = pol
+            item1.populate_rniirs(noise=0.01, override=True)
+            self.assertEqual(item1.CollectionInfo.Parameters['PREDICTED_RNIIRS'], expected)
+        item1.ImageFormation = None
+        item1.populate_rniirs(noise=0.01, override=True)
+        self.assertEqual(item1.CollectionInfo.Parameters['PREDICTED_RNIIRS'], '4.6')
+        # estimate the noise from the radiometric polynomials, evaluated at the origin
+        item1.Radiometric.SigmaZeroSFPoly = {'Coefs': [[0.001, 1.], [2., 0]]}
+        item1.populate_rniirs(signal=1.0, override=True)
+        self.assertEqual(item1.CollectionInfo.Parameters['PREDICTED_RNIIRS'], '5.0')
+
+    def test_des_details(self):
+        details = SICD.SICDType.get_des_details()
+        self.assertEqual(list(details.keys()), ['DESSHSI', 'DESSHSV', 'DESSHSD', 'DESSHTN'])
+        details['DESSHDT'] = '2019-12-11T13:58:27Z'
+        self.assertNotIn('DESSHDT', SICD.SICDType.get_des_details())
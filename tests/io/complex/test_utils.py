@@ -2,7 +2,11 @@
 
 import numpy
 from numpy.polynomial import polynomial
-from sarpy.io.complex.utils import two_dim_poly_fit
+from sarpy.io.complex.utils import two_dim_poly_fit, fit_time_coa_polynomial, snr_to_rniirs, \
+    parse_xml_from_string, get_seconds
+from sarpy.io.complex.sicd_elements.RMA import INCAType
+from sarpy.io.complex.sicd_elements.ImageData import ImageDataType
+from sarpy.io.complex.sicd_elements.Grid import GridType, DirParamType
 
 from . import unittest
 
@@ -15,3 +19,96 @@ class TestRadarSatUtils(unittest.TestCase):
         t_coeffs, residuals, rank, sing_vals = two_dim_poly_fit(x, y, z, x_order=2, y_order=2)
         diff = (numpy.abs(coeffs - t_coeffs) < 1e-10)
         self.assertTrue(numpy.all(diff))
+
+    def test_two_dim_poly_fit_orders(self):
+        coeffs = numpy.arange(8, dtype='float64').reshape((2, 4)) - 3
+        y, x = numpy.meshgrid(numpy.linspace(-1, 2, 6), numpy.linspace(0, 3, 5))
+        z = polynomial.polyval2d(x, y, coeffs)
+        t_coeffs, residuals, rank, sing_vals = two_dim_poly_fit(x, y, z, x_order=1, y_order=3)
+        self.assertEqual(t_coeffs.shape, (2, 4))
+        self.assertTrue(numpy.allclose(coeffs, t_coeffs, atol=1e-10))
+
+    def test_two_dim_poly_fit_conditioning(self):
+        # physical coordinates in meters, without any manual scaling
+        coeffs = numpy.array([[2.5, 1e-4, 3e-9], [-2e-4, 5e-9, 0], [1e-8, 0, 0]])
+        y, x = numpy.meshgrid(numpy.linspace(-2e4, 2e4, 7), numpy.linspace(-1.5e4, 1.5e4, 7))
+        z = polynomial.polyval2d(x, y, coeffs)
+        t_coeffs, residuals, rank, sing_vals = two_dim_poly_fit(x, y, z, x_order=2, y_order=2)
+        self.assertEqual(rank, 9)
+        self.assertTrue(numpy.allclose(polynomial.polyval2d(x, y, t_coeffs), z, rtol=1e-8, atol=1e-8))
+
+    def test_fit_time_coa_polynomial(self):
+        inca = INCAType(
+            TimeCAPoly=[1.5, 2e-4, 3e-9], DopCentroidPoly=[[10, 1e-3, 2e-7], [-2e-3, 1e-7, 0], [3e-7, 0, 0]])
+        image_data = ImageDataType(PixelType='RE32F_IM32F', NumRows=8000, NumCols=12000, SCPPixel=[4100, 5900])
+        grid = GridType(Row=DirParamType(SS=1.2), Col=DirParamType(SS=0.8))
+        dop_rate = numpy.array([-500., 1e-3, 2e-8])
+        time_coa_poly = fit_time_coa_polynomial(inca, image_data, grid, dop_rate, poly_order=2)
+
+        # compare with the direct fit over the same sample grid
+        coords_az = (numpy.linspace(0, 11999, 5) - 5900)*0.8
+        coords_rg = (numpy.linspace(0, 7999, 5) - 4100)*1.2
+        coords_az_2d, coords_rg_2d = numpy.meshgrid(coords_az, coords_rg)
+        time_coa_sampled = inca.TimeCAPoly(coords_az_2d) + \
+            inca.DopCentroidPoly(coords_rg_2d, coords_az_2d)/polynomial.polyval(coords_rg_2d, dop_rate)
+        coefs, residuals, rank, sing_vals = two_dim_poly_fit(
+            coords_rg_2d, coords_az_2d, time_coa_sampled, x_order=2, y_order=2)
+        self.assertTrue(numpy.allclose(
+            time_coa_poly(coords_rg_2d, coords_az_2d), polynomial.polyval2d(coords_rg_2d, coords_az_2d, coefs),
+            rtol=0, atol=1e-10))
+
+        with self.subTest(msg='Denser sample grid'):
+            dense_poly = fit_time_coa_polynomial(inca, image_data, grid, dop_rate, poly_order=2, grid_samples=9)
+            self.assertTrue(numpy.allclose(
+                dense_poly(coords_rg_2d, coords_az_2d), time_coa_poly(coords_rg_2d, coords_az_2d), rtol=0, atol=1e-4))
+        with self.subTest(msg='Too few samples'):
+            self.assertRaises(
+                ValueError, fit_time_coa_polynomial, inca, image_data, grid, dop_rate, poly_order=2, grid_samples=2)
+
+    def test_snr_to_rniirs(self):
+        bandwidth_area = numpy.array([[1e-4, 1e-3], [1, 10]])
+        signal = numpy.array([2., 4.])
+        info_density, rniirs = snr_to_rniirs(bandwidth_area, signal, 1.)
+        self.assertEqual(rniirs.shape, (2, 2))
+        for index in numpy.ndindex(bandwidth_area.shape):
+            with self.subTest(msg='Comparing with scalar evaluation at {}'.format(index)):
+                scalar_density, scalar_rniirs = snr_to_rniirs(bandwidth_area[index], signal[index[1]], 1.)
+                self.assertEqual(numpy.ndim(scalar_rniirs), 0)
+                self.assertAlmostEqual(info_density[index], scalar_density)
+                self.assertAlmostEqual(rniirs[index], scalar_rniirs)
+        with self.subTest(msg='Linear below the transition'):
+            self.assertAlmostEqual(rniirs[0, 1]/info_density[0, 1], rniirs[0, 0]/info_density[0, 0])
+        with self.subTest(msg='Zero information density'):
+            self.assertEqual(snr_to_rniirs(0., 1., 1.)[1], 0)
+
+    def test_parse_xml_from_string(self):
+        xml_string = '<SICD xmlns="urn:SICD:1.2.1" xmlns:ex="urn:example"><ex:Value>1</ex:Value><Other/></SICD>'
+        for value in [xml_string, xml_string.encode('utf-8')]:
+            with self.subTest(msg='Parsing {}'.format(type(value))):
+                root_node, xml_ns = parse_xml_from_string(value)
+                self.assertEqual(root_node.tag, '{urn:SICD:1.2.1}SICD')
+                self.assertEqual(len(root_node), 2)
+                self.assertEqual(
+                    xml_ns, {'': 'urn:SICD:1.2.1', 'default': 'urn:SICD:1.2.1', 'ex': 'urn:example'})
+        with self.subTest(msg='No namespaces'):
+            root_node, xml_ns = parse_xml_from_string('<Root><Child/></Root>')
+            self.assertEqual(root_node.tag, 'Root')
+            self.assertIsNone(xml_ns)
+
+    def test_get_seconds(self):
+        dt1 = numpy.datetime64('2020-01-01T00:01:02.123456789', 'ns')
+        dt2 = numpy.datetime64('2020-01-01T00:00:00', 's')
+        for precision, expected in [('s', 62), ('ms', 62.123), ('us', 62.123456), ('ns', 62.123456789)]:
+            with self.subTest(msg='Precision {}'.format(precision)):
+                value = get_seconds(dt1, dt2, precision=precision)
+                self.assertIsInstance(value, float)
+                self.assertAlmostEqual(value, expected, places=12)
+        with self.subTest(msg='Negative difference'):
+            self.assertAlmostEqual(get_seconds(dt2, dt1, precision='ms'), -62.123, places=12)
+        with self.subTest(msg='Unrecognized precision'):
+            self.assertRaises(ValueError, get_seconds, dt1, dt2, precision='m')
+        with self.subTest(msg='Array arguments'):
+            times = numpy.array(['2020-01-01T00:00:01', '2020-01-01T00:01:00.5'], dtype='datetime64[ms]')
+            value = get_seconds(times, dt2, precision='ms')
+            self.assertIsInstance(value, numpy.ndarray)
+            self.assertTrue(numpy.allclose(value, [1, 60.5]))
@@ -3,9 +3,22 @@ from . import unittest
 
 from sarpy.io.nitf.tres.registration import find_tre
 from sarpy.io.nitf.tres.unclass.ACFTA import ACFTA
+from sarpy.io.nitf.tres.unclass.OFFSET import OFFSET
 
 
 class TestTreRegistry(unittest.TestCase):
     def test_find_tre(self):
         the_tre = find_tre('ACFTA')
         self.assertEqual(the_tre, ACFTA)
+
+
+class TestOFFSET(unittest.TestCase):
+    def test_parse_many(self):
+        value = b'0000001200000034-000000500000078'
+        parsed = OFFSET.parse_many(value, 2)
+        self.assertEqual(parsed.shape, (2, ))
+        for i in range(2):
+            with self.subTest(msg='Comparing with OFFSET entry {}'.format(i)):
+                tre = OFFSET(value[16*i:16*(i+1)])
+                self.assertEqual(parsed['LINE'][i], tre.DATA.LINE)
+                self.assertEqual(parsed['SAMPLE'][i], tre.DATA.SAMPLE)
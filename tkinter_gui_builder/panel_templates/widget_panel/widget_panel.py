@@ -1,4 +1,3 @@
-import numpy as np
 from typing import Union
 import tkinter
 
@@ -10,6 +9,7 @@ class AbstractWidgetPanel(tkinter.LabelFrame):
         tkinter.LabelFrame.__init__(self, parent)
         self.config(borderwidth=2)
         self._widget_list = None     # type: list
+        self._resolved_widgets = None     # type: list
         self.rows = None           # type: tkinter.Frame
 
     def init_w_xy_positions_dict(self, positions_dict):
@@ -28,7 +28,7 @@ class AbstractWidgetPanel(tkinter.LabelFrame):
                                ):
         self.init_w_basic_widget_list(basic_widget_list,
                                       n_rows=len(basic_widget_list),
-                                      n_widgets_per_row_list=list(np.ones(len(basic_widget_list))))
+                                      n_widgets_per_row_list=[1]*len(basic_widget_list))
 
     def init_w_box_layout(self,
                           basic_widget_list,  # type: list
@@ -37,20 +37,14 @@ class AbstractWidgetPanel(tkinter.LabelFrame):
                           row_heights=None,  # type: Union[int, list]
                           ):
         n_total_widgets = len(basic_widget_list)
-        n_rows = int(np.ceil(n_total_widgets/n_columns))
-        n_widgets_per_row = []
-        n_widgets_left = n_total_widgets
-        for i in range(n_rows):
-            n_widgets = n_widgets_left/n_columns
-            if n_widgets >= 1:
-                n_widgets_per_row.append(n_columns)
-            else:
-                n_widgets_per_row.append(n_widgets_left)
-            n_widgets_left -= n_columns
+        n_rows = -(-n_total_widgets // n_columns)
+        # every row is full, except possibly the last
+        n_widgets_per_row = [n_columns]*(n_total_widgets // n_columns)
+        if n_total_widgets % n_columns:
+            n_widgets_per_row.append(n_total_widgets % n_columns)
         self.init_w_basic_widget_list(basic_widget_list, n_rows, n_widgets_per_row)
         for i, widget in enumerate(basic_widget_list):
-            column_num = np.mod(i, n_columns)
-            row_num = int(i/n_columns)
+            row_num, column_num = divmod(i, n_columns)
             if column_widths is not None and isinstance(column_widths, type(1)):
                 getattr(self, widget).config(width=column_widths)
             elif column_widths is not None and isinstance(column_widths, type([])):
@@ -82,27 +76,26 @@ class AbstractWidgetPanel(tkinter.LabelFrame):
             row.config(borderwidth=2)
             row.pack()
 
-        # find transition points
-        transitions = np.cumsum(n_widgets_per_row_list)
+        # the row number for each widget
+        row_of_widget = [row_num for row_num in range(n_rows) for _ in range(int(n_widgets_per_row_list[row_num]))]
         self._widget_list = []
-        row_num = 0
+        self._resolved_widgets = []
         for i, widget in enumerate(basic_widget_list):
-            print(widget)
-            if i in transitions:
-                row_num += 1
-            setattr(self, widget, getattr(self, widget)(self.rows[row_num]))
-            getattr(self, widget).pack(side="left", padx=5, pady=5)
-            if getattr(self, widget).widgetName in NO_TEXT_UPDATE_WIDGETS:
-                pass
-            else:
-                getattr(self, widget).config(text=widget.replace("_", " "))
+            row_num = row_of_widget[i]
+            # replace the widget class attribute with the instance
+            w = getattr(self, widget)(self.rows[row_num])
+            setattr(self, widget, w)
+            w.pack(side="left", padx=5, pady=5)
+            if w.widgetName not in NO_TEXT_UPDATE_WIDGETS:
+                w.config(text=widget.replace("_", " "))
             self._widget_list.append(widget)
+            self._resolved_widgets.append(w)
 
     def set_spacing_between_buttons(self, spacing_npix_x=0, spacing_npix_y=None):
         if spacing_npix_y is None:
             spacing_npix_y = spacing_npix_x
-        for widget in self._widget_list:
-            getattr(self, widget).pack(side="left", padx=spacing_npix_x, pady=spacing_npix_y)
+        for w in self._resolved_widgets:
+            w.pack(side="left", padx=spacing_npix_x, pady=spacing_npix_y)
 
     def set_label_text(self,
                        label,               # type: str
@@ -110,34 +103,22 @@ class AbstractWidgetPanel(tkinter.LabelFrame):
         self.config(text=label)
 
     def unpress_all_buttons(self):
-        for i, widget_and_name in enumerate(self._widget_list):
-            widget = widget_and_name
-            if type(("", "")) == type(widget_and_name):
-                widget = widget_and_name[0]
-            if getattr(self, widget).widgetName == "button":
-                getattr(self, widget).config(relief="raised")
+        for w in self._resolved_widgets:
+            if w.widgetName == "button":
+                w.config(relief="raised")
 
     def press_all_buttons(self):
-        for i, widget_and_name in enumerate(self._widget_list):
-            widget = widget_and_name
-            if type(("", "")) == type(widget_and_name):
-                widget = widget_and_name[0]
-            if getattr(self, widget).widgetName == "button":
-                getattr(self, widget).config(relief="sunken")
+        for w in self._resolved_widgets:
+            if w.widgetName == "button":
+                w.config(relief="sunken")
 
     def activate_all_buttons(self):
-        for i, widget_and_name in enumerate(self._widget_list):
-            widget = widget_and_name
-            if type(("", "")) == type(widget_and_name):
-                widget = widget_and_name[0]
-            getattr(self, widget).config(state="normal")
+        for w in self._resolved_widgets:
+            w.config(state="normal")
 
     def disable_all_buttons(self):
-        for i, widget_and_name in enumerate(self._widget_list):
-            widget = widget_and_name
-            if type(("", "")) == type(widget_and_name):
-                widget = widget_and_name[0]
-            getattr(self, widget).config(state="disabled")
+        for w in self._resolved_widgets:
+            w.config(state="disabled")
 
     def set_active_button(self,
                           button,